@@ -2,9 +2,10 @@ import discord
 from discord.ext import commands, tasks
 import logging
 import asyncio
-from database.connection import Database
+import time
+from database.connection import Database, CASE_INSENSITIVE_COLLATION
 from parsers.parser_memory import ParserMemory
-from database.models import Player
+from utils.premium_cache import invalidate_guild
 from utils.premium import (
     get_premium_tiers, 
     get_guild_premium_tier,
@@ -18,12 +19,28 @@ from datetime import datetime, timedelta
 
 logger = logging.getLogger('deadside_bot.cogs.admin')
 
+# Maximum number of documents removed per delete in admin cleanup
+CLEANUP_BATCH_SIZE = 10000
+
+def _tier_limit_fields(limits):
+    """Build (name, value) embed fields for a tier's limits"""
+    return [
+        (feature.replace('_', ' ').title(), str(value) if value is not None else "Unlimited")
+        for feature, value in limits.items()
+    ]
+
 class AdminCommands(commands.Cog):
     """Administrative commands for bot management"""
     
     def __init__(self, bot):
         self.bot = bot
-        self.db = getattr(bot, 'db', None)  # Get db from bot if available
+        self._db_cache = None  # Database singleton, resolved on first use
+    
+    async def _get_db(self):
+        """Get the shared Database instance, resolving it only once per cog"""
+        if self._db_cache is None:
+            self._db_cache = await Database.get_instance()
+        return self._db_cache
     
     @commands.group(name="admin", invoke_without_command=True)
     @commands.has_permissions(administrator=True)
@@ -36,17 +53,21 @@ class AdminCommands(commands.Cog):
     async def show_stats(self, ctx):
         """View bot statistics and performance metrics"""
         try:
-            db = await Database.get_instance()
-            
-            # Get counts of various collections
-            servers_coll = await db.get_collection("servers")
-            players_coll = await db.get_collection("players")
-            kills_coll = await db.get_collection("kills")
-            events_coll = await db.get_collection("server_events")
-            connections_coll = await db.get_collection("connection_events")
-            
-            # Determine if we should show global stats or guild-specific stats
-            is_admin_in_home = await is_home_guild_admin(ctx)
+            db = await self._get_db()
+            
+            # Resolve collections, admin scope and premium info concurrently
+            (servers_coll, players_coll, kills_coll, events_coll, connections_coll,
+             is_admin_in_home, home_guild_flag, tier) = await asyncio.gather(
+                db.get_collection("servers"),
+                db.get_collection("players"),
+                db.get_collection("kills"),
+                db.get_collection("server_events"),
+                db.get_collection("connection_events"),
+                # Determine if we should show global stats or guild-specific stats
+                is_home_guild_admin(ctx),
+                is_home_guild(ctx.guild.id),
+                get_guild_premium_tier(ctx.guild.id)
+            )
             
             # Filter for guild-specific stats if not a home guild admin
             if is_admin_in_home:
@@ -56,34 +77,47 @@ class AdminCommands(commands.Cog):
                 guild_filter = {"guild_id": ctx.guild.id}
                 stats_scope = "Guild"
             
-            # Get guild-filtered server count
-            servers_count = await servers_coll.count_documents(guild_filter)
+            # Get server IDs for this guild/filter to filter related collections;
+            # the server count falls out of the same query
+            server_ids = await servers_coll.distinct("_id", guild_filter)
+            servers_count = len(server_ids)
             
-            # Get server IDs for this guild/filter to filter related collections
-            cursor = servers_coll.find(guild_filter)
-            servers = await cursor.to_list(None)
-            server_ids = [server["_id"] for server in servers]
+            # Players are global, but can limit to those seen on guild servers if desired.
+            # The total is approximate: it is read from collection metadata instead of scanning.
+            players_count_coro = players_coll.estimated_document_count()
+            
+            # Parser memory usage - filter by guild servers if not home admin
+            parsers_count_coro = ParserMemory.count_parsers(
+                ["csv", "log"],
+                server_ids=None if is_admin_in_home else server_ids
+            )
             
             # Filter for server-specific data using the server IDs
             if server_ids:
                 server_filter = {"server_id": {"$in": server_ids}}
                 
-                # Count related data
-                kills_count = await kills_coll.count_documents(server_filter)
-                events_count = await events_coll.count_documents(server_filter)
-                connections_count = await connections_coll.count_documents(server_filter)
+                # Count related data concurrently
+                (kills_count, events_count, connections_count,
+                 players_count, memory_parsers) = await asyncio.gather(
+                    kills_coll.count_documents(server_filter),
+                    events_coll.count_documents(server_filter),
+                    connections_coll.count_documents(server_filter),
+                    players_count_coro,
+                    parsers_count_coro
+                )
             else:
                 # No servers for this guild
                 kills_count = 0
                 events_count = 0
                 connections_count = 0
-            
-            # Players are global, but can limit to those seen on guild servers if desired
-            players_count = await players_coll.count_documents({})
+                players_count, memory_parsers = await asyncio.gather(
+                    players_count_coro,
+                    parsers_count_coro
+                )
             
             # Guild count and uptime are shown for all admins
             guilds_count = len(self.bot.guilds)
-            uptime = datetime.utcnow() - datetime.fromtimestamp(self.bot.launch_time)
+            uptime = timedelta(seconds=int(time.monotonic() - self.bot.launch_time_monotonic))
             
             # Create embed with scope-appropriate title
             embed = discord.Embed(
@@ -93,54 +127,41 @@ class AdminCommands(commands.Cog):
             )
             
             # Discord stats field - show guild count only for home guild admins
-            discord_stats = f"Latency: {round(self.bot.latency * 1000)}ms\n"
-            discord_stats += f"Uptime: {str(uptime).split('.')[0]}"
+            discord_lines = [
+                f"Latency: {round(self.bot.latency * 1000)}ms",
+                f"Uptime: {uptime}"
+            ]
             
             if is_admin_in_home:
-                discord_stats = f"Guilds: {guilds_count}\n" + discord_stats
+                discord_lines.insert(0, f"Guilds: {guilds_count}")
             
             embed.add_field(
                 name="Discord Stats",
-                value=discord_stats
+                value="\n".join(discord_lines)
             )
             
             # Database stats field
-            db_stats = f"Servers: {servers_count}\n"
-            db_stats += f"Players: {players_count}\n"
-            db_stats += f"Kills: {kills_count}\n"
-            db_stats += f"Events: {events_count}\n"
-            db_stats += f"Connections: {connections_count}"
-            
             embed.add_field(
                 name=f"Database Stats ({stats_scope})",
-                value=db_stats
+                value="\n".join((
+                    f"Servers: {servers_count}",
+                    f"Players: {players_count}",
+                    f"Kills: {kills_count}",
+                    f"Events: {events_count}",
+                    f"Connections: {connections_count}"
+                ))
             )
             
-            # Parser memory usage - filter by guild servers if not home admin
-            if is_admin_in_home:
-                # Show all parsers
-                csv_parsers = await ParserMemory.get_parsers_by_type("csv")
-                log_parsers = await ParserMemory.get_parsers_by_type("log")
-            else:
-                # Filter parsers by guild's servers
-                csv_parsers = [p for p in await ParserMemory.get_parsers_by_type("csv") 
-                              if any(p.server_id == server_id for server_id in server_ids)]
-                log_parsers = [p for p in await ParserMemory.get_parsers_by_type("log")
-                              if any(p.server_id == server_id for server_id in server_ids)]
-            
-            memory_parsers = len(csv_parsers) + len(log_parsers)
-            
             embed.add_field(
                 name="Parser Stats",
                 value=f"Active Parsers: {memory_parsers}"
             )
             
             # Add home guild and premium tier info
-            if await is_home_guild(ctx.guild.id):
+            if home_guild_flag:
                 embed.add_field(name="Home Guild", value="Yes ✅", inline=True)
                 embed.add_field(name="Premium Tier", value="Enterprise", inline=True)
             else:
-                tier = await db.get_guild_premium_tier(ctx.guild.id)
                 embed.add_field(name="Premium Tier", value=tier, inline=True)
             
             await ctx.send(embed=embed)
@@ -164,7 +185,7 @@ class AdminCommands(commands.Cog):
         Note: Only home guild admins can set premium tiers for other guilds.
         """
         try:
-            db = await Database.get_instance()
+            db = await self._get_db()
             
             # Only home guild admins can set premium tiers for other guilds
             if guild_id is not None and guild_id != ctx.guild.id:
@@ -192,10 +213,8 @@ class AdminCommands(commands.Cog):
                     color=discord.Color.gold()
                 )
                 
-                for feature, value in limits.items():
-                    embed.add_field(name=feature.replace('_', ' ').title(), 
-                                   value=str(value) if value is not None else "Unlimited", 
-                                   inline=True)
+                for name, value in _tier_limit_fields(limits):
+                    embed.add_field(name=name, value=value, inline=True)
                 
                 await ctx.send(embed=embed)
                 return
@@ -212,10 +231,8 @@ class AdminCommands(commands.Cog):
                     color=discord.Color.blue()
                 )
                 
-                for feature, value in limits.items():
-                    embed.add_field(name=feature.replace('_', ' ').title(), 
-                                   value=str(value) if value is not None else "Unlimited", 
-                                   inline=True)
+                for name, value in _tier_limit_fields(limits):
+                    embed.add_field(name=name, value=value, inline=True)
                 
                 await ctx.send(embed=embed)
                 return
@@ -248,29 +265,28 @@ class AdminCommands(commands.Cog):
         This allows users to see their own stats with !stats me
         """
         try:
-            db = await Database.get_instance()
+            db = await self._get_db()
             
-            # Find player by name
+            # Find player by name (case-insensitive, served by the collated index)
+            # and set the Discord ID in the same round-trip
             collection = await db.get_collection("players")
-            cursor = collection.find({
-                "player_name": {"$regex": f"^{player_name}$", "$options": "i"}
-            })
-            players = await cursor.to_list(None)
+            player_doc = await collection.find_one_and_update(
+                {"player_name": player_name},
+                {"$set": {"discord_id": str(member.id)}},
+                projection={"player_name": 1},
+                collation=CASE_INSENSITIVE_COLLATION
+            )
             
-            if not players:
-                await ctx.send(f"⚠️ Player '{player_name}' not found. Names are case-sensitive.")
+            if not player_doc:
+                await ctx.send(f"⚠️ Player '{player_name}' not found.")
                 return
             
-            # Update player with Discord ID
-            player = Player(**{**players[0], "_id": players[0]["_id"]})
-            player.discord_id = str(member.id)
-            await player.update(db)
-            
-            await ctx.send(f"✅ Linked player '{player.player_name}' to Discord user {member.mention}")
+            linked_name = player_doc["player_name"]
+            await ctx.send(f"✅ Linked player '{linked_name}' to Discord user {member.mention}")
             
             # Send DM to user
             try:
-                await member.send(f"Your Deadside game account '{player.player_name}' has been linked to your Discord account. "
+                await member.send(f"Your Deadside game account '{linked_name}' has been linked to your Discord account. "
                                  f"You can now use `!stats me` to view your in-game statistics.")
             except:
                 # User might have DMs disabled
@@ -292,27 +308,24 @@ class AdminCommands(commands.Cog):
         Otherwise, all player links for the user are removed.
         """
         try:
-            db = await Database.get_instance()
+            db = await self._get_db()
             
             if player_name:
-                # Find specific player
+                # Find specific player (case-insensitive, served by the collated index)
+                # and remove the Discord ID in the same round-trip
                 collection = await db.get_collection("players")
-                cursor = collection.find({
-                    "player_name": {"$regex": f"^{player_name}$", "$options": "i"},
-                    "discord_id": str(member.id)
-                })
-                players = await cursor.to_list(None)
+                player_doc = await collection.find_one_and_update(
+                    {"player_name": player_name, "discord_id": str(member.id)},
+                    {"$set": {"discord_id": None}},
+                    projection={"player_name": 1},
+                    collation=CASE_INSENSITIVE_COLLATION
+                )
                 
-                if not players:
+                if not player_doc:
                     await ctx.send(f"⚠️ Player '{player_name}' not found or not linked to {member.mention}.")
                     return
                 
-                # Update player to remove Discord ID
-                player = Player(**{**players[0], "_id": players[0]["_id"]})
-                player.discord_id = None
-                await player.update(db)
-                
-                await ctx.send(f"✅ Unlinked player '{player.player_name}' from Discord user {member.mention}")
+                await ctx.send(f"✅ Unlinked player '{player_doc['player_name']}' from Discord user {member.mention}")
             else:
                 # Remove all links for this user
                 collection = await db.get_collection("players")
@@ -327,6 +340,31 @@ class AdminCommands(commands.Cog):
             logger.error(f"Error unlinking player: {e}")
             await ctx.send(f"⚠️ An error occurred: {e}")
     
+    async def _delete_older_than(self, collection, field, cutoff_date, hint):
+        """
+        Delete documents older than a cutoff in bounded batches
+        
+        Args:
+            collection: Collection to clean up
+            field: Date field to compare against the cutoff
+            cutoff_date: Documents with field older than this are removed
+            hint: Index on field used to select each batch
+            
+        Returns:
+            int: Total number of deleted documents
+        """
+        deleted = 0
+        query = {field: {"$lt": cutoff_date}}
+        
+        while True:
+            # Select one batch of IDs via the index so no single delete holds the DB for long
+            batch = await collection.find(query, {"_id": 1}).hint(hint).limit(CLEANUP_BATCH_SIZE).to_list(None)
+            if not batch:
+                return deleted
+            
+            result = await collection.delete_many({"_id": {"$in": [doc["_id"] for doc in batch]}})
+            deleted += result.deleted_count
+    
     @admin.command(name="cleanup")
     @commands.has_permissions(administrator=True)
     async def cleanup_data(self, ctx, data_type: str = "parsers", days: int = 30):
@@ -343,33 +381,26 @@ class AdminCommands(commands.Cog):
                 await ctx.send("⚠️ Days must be at least 1.")
                 return
             
-            db = await Database.get_instance()
+            db = await self._get_db()
             cutoff_date = datetime.utcnow() - timedelta(days=days)
-            result = None
             
             if data_type.lower() == "parsers":
                 # Clean old parser states
                 collection = await db.get_collection("parser_state")
-                result = await collection.delete_many({
-                    "updated_at": {"$lt": cutoff_date}
-                })
-                message = f"Cleaned up {result.deleted_count} old parser states."
+                deleted = await self._delete_older_than(collection, "updated_at", cutoff_date, [("updated_at", 1)])
+                message = f"Cleaned up {deleted} old parser states."
             
             elif data_type.lower() == "connections":
                 # Clean old connection events
                 collection = await db.get_collection("connection_events")
-                result = await collection.delete_many({
-                    "timestamp": {"$lt": cutoff_date}
-                })
-                message = f"Cleaned up {result.deleted_count} old connection events."
+                deleted = await self._delete_older_than(collection, "timestamp", cutoff_date, [("timestamp", -1)])
+                message = f"Cleaned up {deleted} old connection events."
             
             elif data_type.lower() == "kills":
                 # Clean old kill events
                 collection = await db.get_collection("kills")
-                result = await collection.delete_many({
-                    "timestamp": {"$lt": cutoff_date}
-                })
-                message = f"Cleaned up {result.deleted_count} old kill events."
+                deleted = await self._delete_older_than(collection, "timestamp", cutoff_date, [("timestamp", 1)])
+                message = f"Cleaned up {deleted} old kill events."
             
             else:
                 await ctx.send("⚠️ Invalid data type. Available types: parsers, connections, kills")
@@ -394,7 +425,7 @@ class AdminCommands(commands.Cog):
         This command can only be used by the bot owner.
         """
         try:
-            db = await Database.get_instance()
+            db = await self._get_db()
             
             # If no guild_id provided, show current home guild
             if guild_id is None:
@@ -454,25 +485,23 @@ class AdminCommands(commands.Cog):
                     return
                 
                 # Proceed with purge
-                db = await Database.get_instance()
+                db = await self._get_db()
                 
-                # Get servers for this guild
+                # Get server IDs for this guild
                 collection = await db.get_collection("servers")
-                cursor = collection.find({"guild_id": ctx.guild.id})
-                servers = await cursor.to_list(None)
-                server_ids = [server["_id"] for server in servers]
-                
-                # Delete servers
-                servers_collection = await db.get_collection("servers")
-                result_servers = await servers_collection.delete_many({"guild_id": ctx.guild.id})
+                server_ids = await collection.distinct("_id", {"guild_id": ctx.guild.id})
                 
-                # Delete parser states for those servers
+                # Delete servers, parser states for those servers and guild config together
                 parser_collection = await db.get_collection("parser_state")
-                result_parsers = await parser_collection.delete_many({"server_id": {"$in": server_ids}})
-                
-                # Delete guild config
                 config_collection = await db.get_collection("guild_configs")
-                result_config = await config_collection.delete_many({"guild_id": ctx.guild.id})
+                result_servers, result_parsers, result_config = await asyncio.gather(
+                    collection.delete_many({"guild_id": ctx.guild.id}),
+                    parser_collection.delete_many({"server_id": {"$in": server_ids}}),
+                    config_collection.delete_many({"guild_id": ctx.guild.id})
+                )
+                
+                # The guild's premium tier is gone, so drop its cached lookups too
+                invalidate_guild(ctx.guild.id)
                 
                 # Send summary
                 await ctx.send(f"✅ Purge completed:\n"
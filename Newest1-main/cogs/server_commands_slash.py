@@ -50,12 +50,18 @@ class ServerCommands(commands.Cog):
                 return
             
             # Check if we have reached server limit
-            guild_config = await GuildConfig.get_or_create(self.db, ctx.guild.id)
             existing_servers = await Server.get_by_guild(self.db, ctx.guild.id)
             
-            # Import premium tier info
-            from utils.premium import get_premium_limits
-            premium_limits = await get_premium_limits(guild_config.premium_tier)
+            # Reuse the limits resolved for this command when available
+            premium = getattr(ctx, 'premium', None)
+            if premium is not None:
+                premium_limits = premium[1]
+            else:
+                guild_config = await GuildConfig.get_or_create(self.db, ctx.guild.id)
+                
+                # Import premium tier info
+                from utils.premium import get_premium_limits
+                premium_limits = await get_premium_limits(guild_config.premium_tier)
             
             if len(existing_servers) >= premium_limits["max_servers"]:
                 await ctx.respond(f"⚠️ You have reached the maximum number of servers for your plan ({premium_limits['max_servers']}). "
@@ -333,5 +339,6 @@ class ServerCommands(commands.Cog):
             await ctx.respond(f"⚠️ An error occurred: {e}")
 
 def setup(bot):
-    bot.add_application_command(server_group)
+    # add_cog registers server_group through its subcommands; adding it
+    # separately as well would register the group twice
     bot.add_cog(ServerCommands(bot))
\ No newline at end of file
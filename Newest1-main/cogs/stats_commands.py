@@ -1,7 +1,7 @@
 import discord
 from discord.ext import commands, tasks
 import logging
-from database.connection import Database
+from database.connection import Database, CASE_INSENSITIVE_COLLATION
 from database.models import Server, Player, Kill
 from utils.embeds import create_player_stats_embed, create_server_stats_embed
 from bson import ObjectId
@@ -30,11 +30,12 @@ class StatsCommands(commands.Cog):
         try:
             db = await Database.get_instance()
             
-            # Find player by name (case-insensitive)
+            # Find player by name (case-insensitive, served by the collated index)
             collection = await db.get_collection("players")
-            cursor = collection.find({
-                "player_name": {"$regex": f"^{player_name}$", "$options": "i"}
-            })
+            cursor = collection.find(
+                {"player_name": player_name},
+                collation=CASE_INSENSITIVE_COLLATION
+            )
             players = await cursor.to_list(None)
             
             if not players:
@@ -277,16 +278,16 @@ class StatsCommands(commands.Cog):
             if player_name:
                 # Get weapon stats for a specific player
                 collection = await db.get_collection("players")
-                cursor = collection.find({
-                    "player_name": {"$regex": f"^{player_name}$", "$options": "i"}
-                })
-                players = await cursor.to_list(None)
+                player_doc = await collection.find_one(
+                    {"player_name": player_name},
+                    collation=CASE_INSENSITIVE_COLLATION
+                )
                 
-                if not players:
+                if not player_doc:
                     await ctx.send(f"⚠️ Player '{player_name}' not found. Names are case-sensitive.")
                     return
                 
-                player = Player(**{**players[0], "_id": players[0]["_id"]})
+                player = Player(**player_doc)
                 
                 # Find kills by this player
                 pipeline = [
@@ -10,6 +10,11 @@ MONGODB_URI = os.getenv("MONGODB_URI", "mongodb://localhost:27017/discord_bot")
 DATABASE_NAME = os.getenv("MONGODB_DB", "discord_bot")
 DATABASE_URL = os.getenv("DATABASE_URL")
 
+# MongoDB connection pool (one client is shared by every cog and handler)
+MONGODB_MAX_POOL_SIZE = int(os.getenv("MONGODB_MAX_POOL_SIZE", "50"))
+MONGODB_MIN_POOL_SIZE = int(os.getenv("MONGODB_MIN_POOL_SIZE", "5"))
+MONGODB_WAIT_QUEUE_TIMEOUT_MS = int(os.getenv("MONGODB_WAIT_QUEUE_TIMEOUT_MS", "5000"))
+
 # Parser configuration
 PARSER_INTERVAL = int(os.getenv("PARSER_INTERVAL", "300"))  # 5 minutes in seconds
 
@@ -3,11 +3,21 @@ import logging
 import json
 import asyncio
 from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
 from datetime import datetime
-from config import MONGODB_URI, DATABASE_NAME
+from config import (
+    MONGODB_URI,
+    DATABASE_NAME,
+    MONGODB_MAX_POOL_SIZE,
+    MONGODB_MIN_POOL_SIZE,
+    MONGODB_WAIT_QUEUE_TIMEOUT_MS
+)
 
 logger = logging.getLogger('deadside_bot.database')
 
+# Collation for case-insensitive equality lookups (e.g. player names)
+CASE_INSENSITIVE_COLLATION = {"locale": "en", "strength": 2}
+
 class Database:
     """
     Singleton class for managing MongoDB database connections.
@@ -23,8 +33,14 @@ class Database:
         if cls._instance is None:
             cls._instance = cls()
             try:
-                # Connect to MongoDB
-                cls._client = motor.motor_asyncio.AsyncIOMotorClient(MONGODB_URI)
+                # Connect to MongoDB; the pool is sized for handlers that
+                # issue several queries concurrently with asyncio.gather
+                cls._client = motor.motor_asyncio.AsyncIOMotorClient(
+                    MONGODB_URI,
+                    maxPoolSize=MONGODB_MAX_POOL_SIZE,
+                    minPoolSize=MONGODB_MIN_POOL_SIZE,
+                    waitQueueTimeoutMS=MONGODB_WAIT_QUEUE_TIMEOUT_MS
+                )
                 cls._db = cls._client[DATABASE_NAME]
                 
                 # Test connection
@@ -56,6 +72,11 @@ class Database:
             await players.create_index("player_id", unique=True)
             await players.create_index("discord_id")
             await players.create_index("player_name")
+            await players.create_index(
+                "player_name",
+                name="player_name_ci",
+                collation=CASE_INSENSITIVE_COLLATION
+            )
             
             # Create indexes for kills collection
             kills = cls._db["kills"]
@@ -83,6 +104,7 @@ class Database:
                 ("parser_type", 1), 
                 ("is_historical", 1)
             ], unique=True)
+            await parser_state.create_index("updated_at")
             
             # Create indexes for guild_configs collection
             guild_configs = cls._db["guild_configs"]
@@ -101,6 +123,12 @@ class Database:
                     "created_at": datetime.utcnow(),
                     "updated_at": datetime.utcnow()
                 })
+            elif global_config.get("home_guild_id"):
+                # Flag the home guild config so tier updates can exclude it atomically
+                await guild_configs.update_one(
+                    {"guild_id": global_config["home_guild_id"]},
+                    {"$set": {"is_home_guild": True}}
+                )
             
             logger.info("MongoDB collections and indexes initialized")
         except Exception as e:
@@ -123,11 +151,18 @@ class Database:
             logger.error(f"Error getting collection {collection_name}: {e}")
             raise
     
-    async def get_home_guild_id(self):
-        """Get the ID of the home guild"""
+    async def get_home_guild_id(self, raise_errors=False):
+        """
+        Get the ID of the home guild
+        
+        Args:
+            raise_errors: Re-raise lookup errors instead of falling back to None
+        """
         try:
             if self._db is None:
                 logger.error("Database not initialized in get_home_guild_id")
+                if raise_errors:
+                    raise Exception("Database not initialized")
                 return None
             
             try:
@@ -141,9 +176,13 @@ class Database:
                     return None
             except Exception as inner_e:
                 logger.error(f"Error accessing global_config collection: {inner_e}")
+                if raise_errors:
+                    raise
                 return None
         except Exception as e:
             logger.error(f"Error in get_home_guild_id: {e}")
+            if raise_errors:
+                raise
             return None
     
     async def set_home_guild_id(self, guild_id):
@@ -162,45 +201,68 @@ class Database:
         )
         logger.info(f"Set home guild ID to {guild_id}")
         
-        # Also ensure the guild has enterprise premium tier
+        # Also ensure the guild has enterprise premium tier and is flagged as home
         guild_configs = await self.get_collection("guild_configs")
+        await guild_configs.update_many(
+            {"is_home_guild": True, "guild_id": {"$ne": guild_id}},
+            {"$unset": {"is_home_guild": ""}}
+        )
         await guild_configs.update_one(
             {"guild_id": guild_id},
             {"$set": {
                 "premium_tier": "enterprise",
+                "is_home_guild": True,
                 "updated_at": datetime.utcnow()
             }},
             upsert=True
         )
     
-    async def is_home_guild(self, guild_id):
-        """Check if a guild is the home guild"""
+    async def is_home_guild(self, guild_id, raise_errors=False):
+        """
+        Check if a guild is the home guild
+        
+        Args:
+            guild_id: Discord guild ID
+            raise_errors: Re-raise lookup errors instead of falling back to False
+        """
         try:
             if guild_id is None:
                 return False
                 
-            home_guild_id = await self.get_home_guild_id()
+            home_guild_id = await self.get_home_guild_id(raise_errors=raise_errors)
             # Only return True if both values are valid and equal
             if home_guild_id and guild_id:
                 return str(home_guild_id) == str(guild_id)
             return False
         except Exception as e:
             logger.error(f"Error in is_home_guild: {e}")
+            if raise_errors:
+                raise
             return False
     
-    async def get_guild_premium_tier(self, guild_id):
-        """Get the premium tier of a guild"""
+    async def get_guild_premium_tier(self, guild_id, raise_errors=False):
+        """
+        Get the premium tier of a guild
+        
+        Args:
+            guild_id: Discord guild ID
+            raise_errors: Re-raise lookup errors instead of falling back to "free"
+        """
         try:
             if self._db is None:
                 logger.error("Database not initialized in get_guild_premium_tier")
+                if raise_errors:
+                    raise Exception("Database not initialized")
                 return "free"  # Safely fallback to free tier
             
             # If this is the home guild, always return enterprise
             try:
-                if await self.is_home_guild(guild_id):
+                if await self.is_home_guild(guild_id, raise_errors=raise_errors):
                     return "enterprise"
             except Exception as e:
                 logger.error(f"Error checking home guild: {e}")
+                if raise_errors:
+                    raise
                 # Continue execution to check guild config directly
             
             collection = await self.get_collection("guild_configs")
@@ -212,6 +274,8 @@ class Database:
                 return "free"  # Default if no config found or no tier specified
         except Exception as e:
             logger.error(f"Error in get_guild_premium_tier: {e}")
+            if raise_errors:
+                raise
             return "free"  # Safely fallback to free tier
     
     async def set_guild_premium_tier(self, guild_id, tier):
@@ -235,6 +299,37 @@ class Database:
         )
         logger.info(f"Set guild {guild_id} premium tier to {tier}")
     
+    async def try_set_non_home_tier(self, guild_id, tier):
+        """
+        Set the premium tier of a guild unless it is the home guild
+        
+        The home guild check and the update happen in a single atomic write,
+        so there is no window between checking and setting the tier.
+        
+        Returns:
+            bool: True if the tier was set, False if the guild is the home guild
+        """
+        if self._db is None:
+            raise Exception("Database not initialized")
+        
+        collection = await self.get_collection("guild_configs")
+        try:
+            result = await collection.update_one(
+                {"guild_id": guild_id, "is_home_guild": {"$ne": True}},
+                {"$set": {
+                    "premium_tier": tier,
+                    "updated_at": datetime.utcnow()
+                }},
+                upsert=True
+            )
+        except DuplicateKeyError:
+            # The upsert collided with the existing home guild config
+            logger.warning(f"Attempted to change home guild tier to {tier}, ignoring")
+            return False
+        
+        logger.info(f"Set guild {guild_id} premium tier to {tier}")
+        return result.matched_count > 0 or result.upserted_id is not None
+    
     async def close(self):
         """Close the MongoDB connection"""
         if self._client is not None:
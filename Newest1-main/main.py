@@ -2,9 +2,11 @@ import os
 import discord
 import logging
 import asyncio
+import time
 from discord.ext import commands, tasks
 from config import TOKEN, PREFIX, LOGGING_LEVEL
 from database.connection import Database
+from utils.premium import resolve_premium
 from cogs.server_commands_slash import ServerCommands
 from cogs.stats_commands import StatsCommands
 from cogs.killfeed_commands import KillfeedCommands
@@ -92,6 +94,21 @@ async def help_command(ctx):
 # Store database instance at bot level
 bot.db = None
 
+# Monotonic launch reference used for uptime reporting
+bot.launch_time_monotonic = time.monotonic()
+
+@bot.before_invoke
+async def attach_premium(ctx):
+    """Resolve the guild's premium tier and limits once per command as ctx.premium"""
+    ctx.premium = None
+    if ctx.guild is None or not bot.db:
+        return
+    
+    try:
+        ctx.premium = await resolve_premium(ctx.guild.id)
+    except Exception as e:
+        logger.error(f"Error resolving premium tier for guild {ctx.guild.id}: {e}")
+
 @bot.event
 async def on_ready():
     logger.info(f'Bot logged in as {bot.user.name} ({bot.user.id})')
@@ -135,6 +152,17 @@ async def on_ready():
         logger.critical("Failed to establish database connection after multiple attempts")
         return
     
+    # Resolve the bot owner once so owner checks don't need an API call
+    if bot.owner_id is None and not bot.owner_ids:
+        try:
+            app_info = await bot.application_info()
+            if app_info.team:
+                bot.owner_ids = {member.id for member in app_info.team.members}
+            else:
+                bot.owner_id = app_info.owner.id
+        except Exception as e:
+            logger.warning(f"Could not resolve bot owner: {e}")
+    
     # Load cogs after database is established
     await load_cogs()
     
@@ -54,11 +54,15 @@ class ParserMemory:
         return deleted_count
     
     @staticmethod
-    async def get_parsers_by_type(parser_type):
-        """Get all parsers of a specific type"""
+    async def get_parsers_by_type(parser_type, server_ids=None):
+        """Get all parsers of a specific type, optionally limited to the given servers"""
         db = await Database.get_instance()
         collection = await db.get_collection("parser_state")
-        cursor = await collection.find({"parser_type": parser_type})
+        
+        query = {"parser_type": parser_type}
+        if server_ids is not None:
+            query["server_id"] = {"$in": list(server_ids)}
+        cursor = collection.find(query)
         
         parsers = []
         async for state in cursor:
@@ -66,3 +70,14 @@ class ParserMemory:
             parsers.append(state)
             
         return parsers
+    
+    @staticmethod
+    async def count_parsers(parser_types, server_ids=None):
+        """Count parsers of the given types, optionally limited to the given servers"""
+        db = await Database.get_instance()
+        collection = await db.get_collection("parser_state")
+        
+        query = {"parser_type": {"$in": list(parser_types)}}
+        if server_ids is not None:
+            query["server_id"] = {"$in": list(server_ids)}
+        return await collection.count_documents(query)
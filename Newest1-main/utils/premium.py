@@ -1,30 +1,61 @@
 import logging
 import discord
-from config import PREMIUM_TIERS
+from types import MappingProxyType
+import config
+from utils.premium_cache import cached_guild_lookup, uncached, invalidate_guild, invalidate_all
 
 logger = logging.getLogger('deadside_bot.utils.premium')
 
-async def get_premium_tiers():
+# Combined permission bits that grant guild admin access
+_ADMIN_MASK = discord.Permissions(administrator=True, manage_guild=True).value
+
+# Limits used when the tier configuration is missing or unreadable
+_FALLBACK_LIMITS = MappingProxyType({
+    "max_servers": 1,
+    "historical_parsing": False,
+    "max_history_days": 0,
+    "custom_embeds": False,
+    "advanced_stats": False,
+})
+
+# Read-only tier configuration, built on first use by get_premium_tiers()
+_TIERS_CACHE = None
+
+def _load_tiers():
     """
-    Get the available premium tiers and their limits
+    Build a read-only view of the tier configuration
     
     Returns:
-        dict: Premium tier configuration
+        Mapping: Premium tiers, or a free-only fallback if none are configured
     """
     # This could be extended to fetch from a database or API
-    if not PREMIUM_TIERS:
+    if not config.PREMIUM_TIERS:
         logger.error("PREMIUM_TIERS is not defined in config")
         # Provide fallback defaults to prevent NoneType errors
-        return {
-            "free": {
-                "max_servers": 1,
-                "historical_parsing": False,
-                "max_history_days": 0,
-                "custom_embeds": False,
-                "advanced_stats": False,
-            }
-        }
-    return PREMIUM_TIERS
+        return MappingProxyType({"free": _FALLBACK_LIMITS})
+    
+    # Freeze so callers can't mutate shared config
+    return MappingProxyType({
+        tier: MappingProxyType(dict(limits))
+        for tier, limits in config.PREMIUM_TIERS.items()
+    })
+
+async def get_premium_tiers():
+    """
+    Get the available premium tiers and their limits
+    
+    Returns:
+        Mapping: Read-only premium tier configuration
+    """
+    global _TIERS_CACHE
+    if _TIERS_CACHE is None:
+        _TIERS_CACHE = _load_tiers()
+    return _TIERS_CACHE
+
+def invalidate_premium_tiers():
+    """Drop the cached tier configuration so the next lookup reloads it from config"""
+    global _TIERS_CACHE
+    _TIERS_CACHE = None
 
 async def get_premium_limits(tier):
     """
@@ -34,7 +65,7 @@ async def get_premium_limits(tier):
         tier: Premium tier name
         
     Returns:
-        dict: Limits for the specified tier
+        Mapping: Read-only limits for the specified tier
     """
     try:
         tiers = await get_premium_tiers()
@@ -43,18 +74,13 @@ async def get_premium_limits(tier):
         tier_key = str(tier) if tier else "free"
         
         # Return the specified tier or fall back to free
-        return tiers.get(tier_key, tiers.get("free", {}))
+        return tiers.get(tier_key, tiers.get("free", _FALLBACK_LIMITS))
     except Exception as e:
         logger.error(f"Error getting premium limits: {e}")
         # Return fallback defaults to prevent NoneType errors
-        return {
-            "max_servers": 1,
-            "historical_parsing": False,
-            "max_history_days": 0,
-            "custom_embeds": False,
-            "advanced_stats": False,
-        }
+        return _FALLBACK_LIMITS
 
+@cached_guild_lookup(lambda guild_id: (guild_id,))
 async def get_guild_premium_tier(guild_id):
     """
     Get the premium tier for a guild
@@ -73,29 +99,33 @@ async def get_guild_premium_tier(guild_id):
         if db is None:
             import logging
             logging.getLogger('deadside_bot.utils.premium').error("Database instance is None in get_guild_premium_tier")
-            return "free"
+            return uncached("free")
             
         # Home guild always has enterprise tier
+        home_check_failed = False
         try:
-            is_home = await db.is_home_guild(guild_id)
+            is_home = await db.is_home_guild(guild_id, raise_errors=True)
             if is_home:
                 return "enterprise"
         except Exception as e:
             import logging
             logging.getLogger('deadside_bot.utils.premium').error(f"Error checking home guild status: {e}")
-            # Continue to get tier directly
+            # Continue to get tier directly, but don't cache an answer that may miss the home guild
+            home_check_failed = True
         
         # Get guild configuration
         try:
-            return await db.get_guild_premium_tier(guild_id)
+            tier = await db.get_guild_premium_tier(guild_id, raise_errors=True)
         except Exception as e:
             import logging
             logging.getLogger('deadside_bot.utils.premium').error(f"Error getting premium tier from db: {e}")
-            return "free"
+            return uncached("free")
+        
+        return uncached(tier) if home_check_failed else tier
     except Exception as e:
         import logging
         logging.getLogger('deadside_bot.utils.premium').error(f"Unexpected error in get_guild_premium_tier: {e}")
-        return "free"
+        return uncached("free")
 
 async def set_premium_tier(guild_id, tier, ctx=None):
     """
@@ -109,26 +139,25 @@ async def set_premium_tier(guild_id, tier, ctx=None):
     Returns:
         bool: True if successful, False otherwise
     """
-    # Get database instance
-    from database.connection import Database
-    db = await Database.get_instance()
-    
-    # Don't allow changing home guild tier
-    if await db.is_home_guild(guild_id):
-        if ctx:
-            await ctx.send("⚠️ Home guild tier cannot be changed.")
-        return False
-    
-    # Validate tier
+    # Validate tier before touching the database
     tiers = await get_premium_tiers()
     if tier not in tiers:
         if ctx:
             await ctx.send(f"⚠️ Invalid premium tier: {tier}")
         return False
     
+    # Get database instance
+    from database.connection import Database
+    db = await Database.get_instance()
+    
     try:
-        # Update tier in database
-        await db.set_guild_premium_tier(guild_id, tier)
+        # Update tier in database, rejected atomically for the home guild
+        if not await db.try_set_non_home_tier(guild_id, tier):
+            if ctx:
+                await ctx.send("⚠️ Home guild tier cannot be changed.")
+            return False
+        
+        invalidate_guild(guild_id)
         
         if ctx:
             await ctx.send(f"✅ Updated premium tier for guild {guild_id} to {tier}")
@@ -141,27 +170,40 @@ async def set_premium_tier(guild_id, tier, ctx=None):
             await ctx.send("⚠️ Failed to update premium tier.")
         return False
 
-async def check_premium_feature(guild_id, feature):
+async def resolve_premium(guild_id):
+    """
+    Resolve the premium tier and limits for a guild in one pass
+    
+    Args:
+        guild_id: Discord guild ID
+        
+    Returns:
+        tuple: (tier name, read-only limits mapping)
+    """
+    tier = await get_guild_premium_tier(guild_id)
+    limits = await get_premium_limits(tier)
+    return tier, limits
+
+async def check_premium_feature(guild_id, feature, limits=None):
     """
     Check if a guild has access to a premium feature
     
     Args:
         guild_id: Discord guild ID
         feature: Feature name to check
+        limits: Optional limits already resolved for this guild
         
     Returns:
         bool: True if the guild has access to the feature
     """
-    # Get premium tier for guild
-    tier = await get_guild_premium_tier(guild_id)
-    
-    # Get premium limits
-    limits = await get_premium_limits(tier)
+    # Resolve tier and limits only if the caller didn't already
+    if limits is None:
+        _, limits = await resolve_premium(guild_id)
     
     # Check if feature exists and is enabled
     return feature in limits and limits[feature]
 
-async def check_and_notify_limits(ctx, guild_id, feature, current_count=None):
+async def check_and_notify_limits(ctx, guild_id, feature, current_count=None, limits=None):
     """
     Check if a guild is approaching or has reached limits for a feature
     
@@ -170,15 +212,18 @@ async def check_and_notify_limits(ctx, guild_id, feature, current_count=None):
         guild_id: Discord guild ID
         feature: Feature to check (e.g., 'max_servers')
         current_count: Current usage count
+        limits: Optional limits already resolved for this guild
         
     Returns:
         bool: True if under the limit, False if at or over the limit
     """
-    # Get premium tier for guild
-    tier = await get_guild_premium_tier(guild_id)
-    
-    # Get premium limits
-    limits = await get_premium_limits(tier)
+    # Reuse the limits resolved for this command when they belong to the same guild
+    if limits is None:
+        premium = getattr(ctx, 'premium', None)
+        if premium is not None and ctx.guild is not None and str(guild_id) == str(ctx.guild.id):
+            limits = premium[1]
+        else:
+            _, limits = await resolve_premium(guild_id)
     
     # Check if feature has a limit
     if feature not in limits:
@@ -203,6 +248,7 @@ async def check_and_notify_limits(ctx, guild_id, feature, current_count=None):
     
     return True
 
+@cached_guild_lookup(lambda guild_id: (guild_id,))
 async def is_home_guild(guild_id):
     """
     Check if a guild is the home guild
@@ -223,13 +269,13 @@ async def is_home_guild(guild_id):
         if db is None:
             import logging
             logging.getLogger('deadside_bot.utils.premium').error("Database instance is None in is_home_guild")
-            return False
+            return uncached(False)
             
-        return await db.is_home_guild(guild_id)
+        return await db.is_home_guild(guild_id, raise_errors=True)
     except Exception as e:
         import logging
         logging.getLogger('deadside_bot.utils.premium').error(f"Error in is_home_guild: {e}")
-        return False
+        return uncached(False)
 
 async def set_home_guild(guild_id, ctx=None):
     """
@@ -255,6 +301,9 @@ async def set_home_guild(guild_id, ctx=None):
         try:
             await db.set_home_guild_id(guild_id)
             
+            # Home guild status affects every guild's cached lookups
+            invalidate_all()
+            
             if ctx:
                 await ctx.send(f"✅ Set guild {guild_id} as the home guild with enterprise premium tier.")
             
@@ -284,15 +333,8 @@ def is_guild_admin(ctx):
     if not ctx.guild:
         return False
     
-    # Check if user has administrator permission
-    if ctx.author.guild_permissions.administrator:
-        return True
-    
-    # Check if user has manage guild permission
-    if ctx.author.guild_permissions.manage_guild:
-        return True
-    
-    return False
+    # Administrator or manage guild permission, tested in a single mask
+    return bool(ctx.author.guild_permissions.value & _ADMIN_MASK)
 
 async def is_home_guild_admin(ctx):
     """
@@ -307,7 +349,8 @@ async def is_home_guild_admin(ctx):
     if not ctx.guild:
         return False
     
-    # Check if this is the home guild
+    # Check if this is the home guild; the lookup is cached per guild, and the
+    # permission check is cheap, so this result isn't cached per user
     if not await is_home_guild(ctx.guild.id):
         return False
     
@@ -324,5 +367,10 @@ async def is_bot_owner(ctx):
     Returns:
         bool: True if the user is the bot owner
     """
-    # Use built-in check
-    return await ctx.bot.is_owner(ctx.author)
+    # Compare against the owner IDs resolved at startup when available
+    bot = ctx.bot
+    if bot.owner_id is not None or bot.owner_ids:
+        return ctx.author.id == bot.owner_id or ctx.author.id in (bot.owner_ids or ())
+    
+    # Fall back to the built-in check, which fetches application info
+    return await bot.is_owner(ctx.author)
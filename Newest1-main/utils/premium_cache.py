@@ -0,0 +1,94 @@
+import time
+import functools
+import logging
+
+logger = logging.getLogger('deadside_bot.utils.premium_cache')
+
+# How long (in seconds) a cached premium/home guild lookup stays valid
+PREMIUM_CACHE_TTL = 60
+
+# Maximum number of cached lookups kept at once
+PREMIUM_CACHE_MAX_SIZE = 4096
+
+# Maps (function name, guild ID, ...) -> (value, expires_at)
+_cache = {}
+
+class _Uncached:
+    """Fallback result returned to the caller but never stored in the cache"""
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+def uncached(value):
+    """
+    Mark a lookup result as a fallback that must not be cached
+
+    Args:
+        value: Result to return for this call only
+
+    Returns:
+        _Uncached: Wrapper unwrapped by cached_guild_lookup
+    """
+    return _Uncached(value)
+
+def _evict(now):
+    """Drop expired entries, then the oldest ones if the cache is still full"""
+    for key in [key for key, (_, expires_at) in _cache.items() if expires_at <= now]:
+        del _cache[key]
+
+    # Dicts keep insertion order, so the first keys are the oldest
+    while len(_cache) >= PREMIUM_CACHE_MAX_SIZE:
+        del _cache[next(iter(_cache))]
+
+def cached_guild_lookup(key_func):
+    """
+    Cache the result of an async per-guild lookup for PREMIUM_CACHE_TTL seconds
+
+    Results wrapped with uncached() are returned unwrapped and not stored.
+
+    Args:
+        key_func: Callable receiving the wrapped function's arguments and
+            returning a tuple whose first item is the guild ID
+
+    Returns:
+        Decorator for an async function
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = (func.__name__,) + tuple(str(part) for part in key_func(*args, **kwargs))
+            now = time.monotonic()
+
+            entry = _cache.get(key)
+            if entry is not None and entry[1] > now:
+                return entry[0]
+
+            value = await func(*args, **kwargs)
+            # Fallbacks from failed lookups are returned but not cached
+            if isinstance(value, _Uncached):
+                return value.value
+
+            _cache.pop(key, None)
+            if len(_cache) >= PREMIUM_CACHE_MAX_SIZE:
+                _evict(now)
+            _cache[key] = (value, now + PREMIUM_CACHE_TTL)
+            return value
+        return wrapper
+    return decorator
+
+def invalidate_guild(guild_id):
+    """
+    Drop all cached lookups for a guild
+
+    Args:
+        guild_id: Discord guild ID
+    """
+    guild_key = str(guild_id)
+    for key in [key for key in _cache if key[1] == guild_key]:
+        _cache.pop(key, None)
+
+def invalidate_all():
+    """Drop every cached lookup (e.g. when the home guild changes)"""
+    _cache.clear()
+    logger.debug("Cleared premium lookup cache")
@@ -8,19 +8,15 @@ import os
 import re
 import sys
 import logging
+from pathlib import Path
 
 logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('decorator_cleaner')
 
-def find_python_files(directory):
-    """Find all Python files in the given directory."""
-    python_files = []
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith('.py'):
-                python_files.append(os.path.join(root, file))
-    return python_files
+def iter_python_files(directory):
+    """Lazily yield all Python files in the given directory."""
+    return Path(directory).rglob('*.py')
 
 def clean_duplicate_decorators(file_path):
     """Remove duplicate decorators in a file."""
@@ -69,12 +65,11 @@ def main():
     
     # Process all other files
     directory = 'cogs'
-    files = find_python_files(directory)
     cleaned_count = 0
     
-    for file_path in files:
+    for file_path in iter_python_files(directory):
         # Skip the file we already processed
-        if file_path == target_file:
+        if file_path == Path(target_file):
             continue
             
         if clean_duplicate_decorators(file_path):
@@ -1,11 +1,46 @@
 import discord
 from discord.ext import commands, tasks
+from discord.http import Route
 import logging
 from datetime import datetime
 import asyncio
+import time
+
+try:
+    from utils.sync_retry import safe_command_sync
+except ImportError:
+    safe_command_sync = None
 
 logger = logging.getLogger('deadside_bot.admin')
 
+# How long (in seconds) gathered status metrics are reused before refetching
+STATUS_CACHE_TTL = 30
+
+# (name, value template) for each inline field of the status embed
+STATUS_FIELDS = (
+    ("🤖 Bot Info", "Name: {bot_name}\nID: {bot_id}\nPing: {ping}ms"),
+    ("📊 Discord Stats", "Guilds: {guild_count}\nMembers: {total_members}\nCommands Run: {command_count}"),
+    ("🎮 Game Stats", "Servers: {server_count}\nPlayers: {player_count}"),
+)
+STATUS_EMBED_COLOR = discord.Color.green().value
+
+# Commands defined directly on the bot rather than in a cog
+BASE_COMMAND_PAYLOADS = (
+    {
+        "name": "ping",
+        "description": "Check bot response time",
+        "type": 1
+    },
+    {
+        "name": "commands",
+        "description": "Show available commands and help information",
+        "type": 1
+    },
+)
+
+# Minimum time (in seconds) between forced global command syncs
+ADMIN_SYNC_COOLDOWN = 300
+
 # Create a SlashCommandGroup for admin commands
 admin_group = discord.SlashCommandGroup(
     name="admin",
@@ -19,15 +54,122 @@ class AdminCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.db = None
+        # Cached (timestamp, metrics) for the status command
+        self._status_cache = None
+        # Monotonic time of the last successful admin_sync
+        self._last_sync_ts = None
+        # Assume the database is reachable until the health check says otherwise
+        self.bot.db_healthy = True
+        self.db_health_check.start()
+        # bot.version is set in on_ready before cogs are loaded
+        self._version_message = (
+            f"🤖 **Emerald Servers Bot v{getattr(bot, 'version', '1.0.0')}**\n"
+            f"📚 Discord.py Version: {discord.__version__}"
+        )
     
     async def cog_load(self):
         """Called when the cog is loaded"""
         logger.info("Admin commands cog loaded")
     
+    def cog_unload(self):
+        """Clean up when the cog is unloaded"""
+        self.db_health_check.cancel()
+    
+    @tasks.loop(seconds=30.0)
+    async def db_health_check(self):
+        """Ping the database so commands can fail fast while it is unreachable"""
+        try:
+            if not self.bot.db:
+                raise Exception("Database not initialized")
+            await self.bot.db.ping()
+            healthy = True
+        except Exception as e:
+            healthy = False
+            if self.bot.db_healthy:
+                logger.warning(f"Database health check failed: {e}")
+        
+        if healthy and not self.bot.db_healthy:
+            logger.info("Database health check recovered")
+        self.bot.db_healthy = healthy
+    
     # This function is needed to expose the commands to the bot
     def get_commands(self):
         return [admin_group]
     
+    @commands.Cog.listener()
+    async def on_application_command_completion(self, ctx):
+        """Keep a running total of executed commands for the status command"""
+        if not self.bot.db:
+            return
+            
+        try:
+            counters = await self.bot.db.get_collection("bot_counters")
+            await counters.update_one({"_id": "commands"}, {"$inc": {"total": 1}}, upsert=True)
+        except Exception as e:
+            logger.error(f"Error recording command usage: {e}")
+    
+    def _adjust_member_total(self, delta):
+        """Apply a change to the running member total once it has been seeded"""
+        if getattr(self.bot, '_member_total', None) is not None:
+            self.bot._member_total += delta
+    
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild):
+        self._adjust_member_total(guild.member_count or 0)
+        self._status_cache = None
+    
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild):
+        self._adjust_member_total(-(guild.member_count or 0))
+        self._status_cache = None
+    
+    @commands.Cog.listener()
+    async def on_member_join(self, member):
+        self._adjust_member_total(1)
+    
+    @commands.Cog.listener()
+    async def on_member_remove(self, member):
+        self._adjust_member_total(-1)
+    
+    def _get_commands_payload(self):
+        """
+        Get the serialized command payload for guild registration
+        
+        The command tree is static once cogs are loaded, so the payload is
+        built on first use and kept on the bot until load_cogs resets it.
+        
+        Returns:
+            list: Command dicts ready for the guild commands endpoint
+        """
+        commands_payload = getattr(self.bot, '_cached_commands_payload', None)
+        if commands_payload is not None:
+            return commands_payload
+        
+        # Collect all commands from cogs
+        commands_payload = []
+        
+        # Process each cog to collect commands, noting any that fail
+        failed_cogs = []
+        for cog_name, cog in self.bot.cogs.items():
+            get_commands = getattr(cog, "get_commands", None)
+            if get_commands is None:
+                continue
+            try:
+                commands_payload.extend(
+                    cmd.to_dict() for cmd in get_commands() or () if hasattr(cmd, "to_dict")
+                )
+            except Exception as cog_err:
+                failed_cogs.append(cog_name)
+                logger.error(f"Error processing commands from cog {cog_name}: {cog_err}")
+        
+        # Add base commands (ping, commands)
+        commands_payload.extend(BASE_COMMAND_PAYLOADS)
+        
+        # Don't pin a partial payload for the session; retry on the next call
+        if not failed_cogs:
+            self.bot._cached_commands_payload = commands_payload
+        return commands_payload
+    
     @admin_group.command(
         name="sync",
         description="Force sync commands with Discord (Admin only, contexts=[discord.InteractionContextType.guild],)",
@@ -38,25 +180,31 @@ class AdminCommands(commands.Cog):
         """Force synchronize all commands with Discord"""
         await ctx.defer()
         
+        # Back-to-back global syncs only earn rate limits from Discord
+        if self._last_sync_ts is not None:
+            remaining = ADMIN_SYNC_COOLDOWN - (time.monotonic() - self._last_sync_ts)
+            if remaining > 0:
+                await ctx.respond(f"⏳ Commands were synced recently. Try again in {int(remaining) + 1} seconds.")
+                return
+        
         try:
-            # Attempt to use the advanced sync retry module
-            try:
-                from utils.sync_retry import safe_command_sync
-                
+            # Use the advanced sync retry module when available
+            if safe_command_sync is not None:
                 # Force a sync with all commands
                 await ctx.respond("🔄 Syncing commands with Discord... This may take a while due to rate limits.")
                 
                 sync_result = await safe_command_sync(self.bot, force=True)
                 
                 if sync_result:
+                    self._last_sync_ts = time.monotonic()
                     await ctx.followup.send("✅ Command sync completed successfully!")
                 else:
                     await ctx.followup.send("⚠️ Command sync was partially successful. Some commands may take time to appear due to Discord rate limits.")
-                    
-            except ImportError:
+            else:
                 # Fallback to traditional sync
                 await ctx.respond("🔄 Syncing commands with Discord...")
                 await self.bot.sync_commands()
+                self._last_sync_ts = time.monotonic()
                 await ctx.followup.send("✅ Commands synced successfully!")
                 
         except Exception as e:
@@ -80,77 +228,51 @@ class AdminCommands(commands.Cog):
         try:
             config_collection = await self.bot.db.get_collection("bot_config")
             
-            # Set this guild as the home guild
-            await config_collection.update_one(
-                {"_id": "home_guild"},
-                {"$set": {"guild_id": str(ctx.guild.id)}},
-                upsert=True
+            # Serialized command tree, built once per cog load
+            commands_payload = self._get_commands_payload()
+            
+            # Set this guild as the home guild and register commands directly to it
+            # (guild-specific registration bypasses global rate limits) concurrently
+            db_result, api_result = await asyncio.gather(
+                config_collection.update_one(
+                    {"_id": "home_guild"},
+                    {"$set": {"guild_id": str(ctx.guild.id)}},
+                    upsert=True
+                ),
+                self.bot.http.request(
+                    Route(
+                        'PUT',
+                        '/applications/{application_id}/guilds/{guild_id}/commands',
+                        application_id=self.bot.application_id,
+                        guild_id=ctx.guild.id
+                    ),
+                    json=commands_payload
+                ),
+                return_exceptions=True
             )
             
+            if isinstance(db_result, Exception):
+                raise db_result
+            
             # Store in bot memory
             self.bot.home_guild_id = ctx.guild.id
             
             await ctx.respond(f"✅ Set {ctx.guild.name} as the bot's home guild!")
             logger.info(f"Home guild set to {ctx.guild.name} (ID: {ctx.guild.id})")
             
-            # Sync commands to this guild immediately
-            # This uses the new guild-specific registration to bypass rate limits
-            try:
-                await ctx.followup.send("⏳ Syncing commands to this guild...")
-                
-                # Collect all commands from cogs
-                commands_payload = []
-                
-                # Process each cog to collect commands
-                for cog_name, cog in self.bot.cogs.items():
-                    if hasattr(cog, "get_commands") and callable(cog.get_commands):
-                        try:
-                            cog_commands = cog.get_commands()
-                            if cog_commands:
-                                for cmd in cog_commands:
-                                    if hasattr(cmd, 'to_dict'):
-                                        cmd_payload = cmd.to_dict()
-                                        commands_payload.append(cmd_payload)
-                        except Exception as cog_err:
-                            logger.error(f"Error processing commands from cog {cog_name}: {cog_err}")
-                
-                # Add base commands (ping, commands)
-                ping_cmd = {
-                    "name": "ping",
-                    "description": "Check bot response time",
-                    "type": 1
-                }
-                commands_payload.append(ping_cmd)
-                
-                help_cmd = {
-                    "name": "commands",
-                    "description": "Show available commands and help information",
-                    "type": 1
-                }
-                commands_payload.append(help_cmd)
+            if not isinstance(api_result, Exception):
+                await ctx.followup.send(f"✅ Successfully registered {len(commands_payload)} commands to this guild")
+            else:
+                await ctx.followup.send(f"❌ Command registration failed: {api_result}")
                 
-                # Register commands directly to this guild
-                try:
-                    result = await self.bot.http.request(
-                        'PUT',
-                        f"/applications/{self.bot.application_id}/guilds/{ctx.guild.id}/commands",
-                        json=commands_payload
-                    )
-                    
-                    await ctx.followup.send(f"✅ Successfully registered {len(commands_payload)} commands to this guild")
-                except Exception as api_err:
-                    await ctx.followup.send(f"❌ Command registration failed: {api_err}")
-                    
-                    # Try the old method as fallback
-                    if hasattr(self.bot, "sync_application_commands"):
-                        await ctx.followup.send("Trying alternative sync method...")
-                        try:
-                            await self.bot.sync_application_commands(guild_id=ctx.guild.id)
-                            await ctx.followup.send("✅ Commands synced successfully using alternative method")
-                        except Exception as e:
-                            await ctx.followup.send(f"❌ All sync methods failed: {e}")
-            except Exception as e:
-                await ctx.followup.send(f"❌ Error syncing commands: {e}")
+                # Try the old method as fallback
+                if hasattr(self.bot, "sync_application_commands"):
+                    await ctx.followup.send("Trying alternative sync method...")
+                    try:
+                        await self.bot.sync_application_commands(guild_id=ctx.guild.id)
+                        await ctx.followup.send("✅ Commands synced successfully using alternative method")
+                    except Exception as e:
+                        await ctx.followup.send(f"❌ All sync methods failed: {e}")
             
         except Exception as e:
             logger.error(f"Error setting home guild: {e}")
@@ -169,70 +291,100 @@ class AdminCommands(commands.Cog):
         if not self.bot.db:
             await ctx.respond("❌ Database not initialized")
             return
-            
+        
+        # Skip the queries while the database is known to be down, showing the
+        # last known-good numbers if there are any
+        if not self.bot.db_healthy:
+            if self._status_cache:
+                await ctx.respond(embed=self._build_status_embed(self._status_cache[1], stale=True))
+            else:
+                await ctx.respond("❌ Database is currently unreachable")
+            return
+        
         try:
-            # Get database stats
-            servers_collection = await self.bot.db.get_collection("servers")
-            server_count = await servers_collection.count_documents({})
-            
-            # Count guilds
-            guild_count = len(self.bot.guilds)
-            total_members = sum(guild.member_count for guild in self.bot.guilds)
-            
-            # Get player stats
-            players_collection = await self.bot.db.get_collection("players")
-            player_count = await players_collection.count_documents({})
-            
-            # Count command usage if available
-            command_count = 0
-            try:
-                command_stats = await self.bot.db.get_collection("command_stats")
-                pipeline = [{"$group": {"_id": None, "total": {"$sum": "$count"}}}]
-                result = await command_stats.aggregate(pipeline).to_list(1)
-                if result:
-                    command_count = result[0].get("total", 0)
-            except Exception as e:
-                logger.error(f"Error getting command stats: {e}")
-            
-            # Create embed
-            embed = discord.Embed(
-                title="🛡️ Bot Status",
-                description="Current operational statistics",
-                color=discord.Color.green()
-            )
-            
-            # Add fields
-            embed.add_field(
-                name="🤖 Bot Info",
-                value=f"Name: {self.bot.user.name}\nID: {self.bot.user.id}\nPing: {round(self.bot.latency * 1000)}ms",
-                inline=True
-            )
-            
-            embed.add_field(
-                name="📊 Discord Stats",
-                value=f"Guilds: {guild_count}\nMembers: {total_members}",
-                inline=True
-            )
-            
-            embed.add_field(
-                name="🎮 Game Stats",
-                value=f"Servers: {server_count}\nPlayers: {player_count}",
-                inline=True
-            )
-            
-            # Add version info if available
-            if hasattr(self.bot, 'version'):
-                embed.set_footer(text=f"Bot Version: {self.bot.version} | Discord.py Version: {discord.__version__}")
+            # Reuse recently gathered metrics to absorb repeated admin queries
+            if self._status_cache and time.monotonic() - self._status_cache[0] < STATUS_CACHE_TTL:
+                metrics = self._status_cache[1]
             else:
-                embed.set_footer(text=f"Discord.py Version: {discord.__version__}")
+                metrics = await self._collect_status_metrics()
+                self._status_cache = (time.monotonic(), metrics)
             
             # Send the embed
-            await ctx.respond(embed=embed)
+            await ctx.respond(embed=self._build_status_embed(metrics))
             
         except Exception as e:
             logger.error(f"Error retrieving bot status: {e}")
             await ctx.respond(f"❌ Error retrieving bot status: {e}")
     
+    async def _collect_status_metrics(self):
+        """Gather the counts shown by the status command"""
+        servers_collection, players_collection, counters = await asyncio.gather(
+            self.bot.db.get_collection("servers"),
+            self.bot.db.get_collection("players"),
+            self.bot.db.get_collection("bot_counters")
+        )
+        
+        # Get database stats (unfiltered totals read from collection metadata)
+        # concurrently; a failing query only zeroes its own figure
+        server_count, player_count, counter_doc = await asyncio.gather(
+            servers_collection.estimated_document_count(),
+            players_collection.estimated_document_count(),
+            counters.find_one({"_id": "commands"}, {"_id": 0, "total": 1}),
+            return_exceptions=True
+        )
+        
+        if isinstance(server_count, Exception):
+            logger.error(f"Error counting servers: {server_count}")
+            server_count = 0
+        if isinstance(player_count, Exception):
+            logger.error(f"Error counting players: {player_count}")
+            player_count = 0
+        
+        # Count command usage if available
+        command_count = 0
+        if isinstance(counter_doc, Exception):
+            logger.error(f"Error getting command stats: {counter_doc}")
+        elif counter_doc:
+            command_count = counter_doc.get("total", 0)
+        
+        return {
+            "guild_count": len(self.bot.guilds),
+            # Seeded in on_ready and kept current by the member/guild listeners
+            "total_members": getattr(self.bot, '_member_total', 0),
+            "server_count": server_count,
+            "player_count": player_count,
+            "command_count": command_count
+        }
+    
+    def _build_status_embed(self, metrics, stale=False):
+        """Build the status embed from gathered metrics (ping is always live)"""
+        values = dict(
+            metrics,
+            bot_name=self.bot.user.name,
+            bot_id=self.bot.user.id,
+            ping=round(self.bot.latency * 1000)
+        )
+        
+        # Add version info if available; server/player totals come from
+        # collection metadata, so flag them as approximate
+        if hasattr(self.bot, 'version'):
+            footer = f"Bot Version: {self.bot.version} | Discord.py Version: {discord.__version__} | Game counts are approximate"
+        else:
+            footer = f"Discord.py Version: {discord.__version__} | Game counts are approximate"
+        if stale:
+            footer = f"⚠️ Stale: database unreachable | {footer}"
+        
+        return discord.Embed.from_dict({
+            "title": "🛡️ Bot Status",
+            "description": "Current operational statistics",
+            "color": STATUS_EMBED_COLOR,
+            "fields": [
+                {"name": name, "value": template.format_map(values), "inline": True}
+                for name, template in STATUS_FIELDS
+            ],
+            "footer": {"text": footer}
+        })
+    
     @admin_group.command(
         name="version",
         description="Check bot version information",
@@ -241,5 +393,4 @@ class AdminCommands(commands.Cog):
     )
     async def version(self, ctx):
         """Display bot version information"""
-        version = getattr(self.bot, 'version', "1.0.0")
-        await ctx.respond(f"🤖 **Emerald Servers Bot v{version}**\n📚 Discord.py Version: {discord.__version__}")
\ No newline at end of file
+        await ctx.respond(self._version_message)
\ No newline at end of file
@@ -8,25 +8,294 @@ import discord
 from discord.ext import commands, tasks
 from discord.commands import Option, SlashCommandGroup
 import logging
+import asyncio
+import functools
+import re
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 
 from database.connection import Database
-from database.models import Server, Player
+from database.models import Player
 from utils.embeds import create_embed, error_embed
 from utils.analytics import AnalyticsService
+from utils import analytics_cache
 # Use Discord's ApplicationContext for slash commands
 from discord.commands import ApplicationContext
 from utils.decorators import premium_server, server_exists
+from utils.guild_isolation import get_cached_guild_servers
 
 logger = logging.getLogger('deadside_bot.cogs.analytics')
 
+# Maximum number of AnalyticsService aggregations running at once
+MAX_CONCURRENT_ANALYTICS = 8
+
+# Time period (in days) most analytics commands default to
+DEFAULT_TIME_PERIOD = 7
+
+# Maximum number of matches listed when a player search is ambiguous
+PLAYER_SEARCH_LIMIT = 10
+
+# Maximum number of factions fetched for the faction list
+FACTION_LIST_LIMIT = 100
+
+# Discord's limit on the length of an embed field value
+EMBED_FIELD_LIMIT = 1024
+FACTION_LIST_MORE = "_...more factions not shown_"
+
+# Leaderboard rank prefixes for the first ten places
+_RANK_PREFIX = ("🥇 ", "🥈 ", "🥉 ") + tuple(f"**{rank}.** " for rank in range(4, 11))
+
+# 12-hour clock label for each hour of the day, for readability
+_HOUR_LABELS = tuple(f"{(hour % 12) or 12} {'AM' if hour < 12 else 'PM'}" for hour in range(24))
+
+# Error embeds shared across commands; py-cord serializes an embed on send,
+# so one instance can be reused as long as its timestamp is refreshed
+_NO_SERVER_EMBED = error_embed(
+    "No Server Found", 
+    "This Discord server doesn't have any game servers configured."
+)
+
+@functools.lru_cache(maxsize=16)
+def _invalid_index_embed(server_count):
+    """Error embed for a server index outside 1..server_count"""
+    return error_embed(
+        "Invalid Server Index",
+        f"Please provide a server index between 1 and {server_count}."
+    )
+
+def _restamp(embed):
+    """Set a shared embed's timestamp to now before sending it"""
+    embed.timestamp = datetime.utcnow()
+    return embed
+
+def _format_active_hours(active_hours):
+    """Format [{"hour", "count"}] activity entries as embed field text"""
+    return "\n".join(
+        f"{_HOUR_LABELS[hour['hour']]}: **{hour['count']} kills**"
+        for hour in active_hours
+    ) or "No activity data available"
+
 class AnalyticsCog(commands.Cog):
     """Analytics commands for Deadside statistics"""
     
     def __init__(self, bot):
         self.bot = bot
         
+        # Bound how many AnalyticsService aggregations run at once
+        self._analytics_sem = asyncio.Semaphore(MAX_CONCURRENT_ANALYTICS)
+        
+        # Keep the default analytics window warm for interactive commands
+        self.refresh_default_analytics.start()
+        
+    def cog_unload(self):
+        """Clean up when the cog is unloaded"""
+        self.refresh_default_analytics.cancel()
+    
+    @tasks.loop(seconds=60.0)
+    async def refresh_default_analytics(self):
+        """Recompute server stats and leaderboards for the default 7-day window"""
+        try:
+            db = Database.instance() or await Database.get_instance()
+            servers_collection = await db.get_collection("servers")
+            server_ids = [str(doc["_id"]) for doc in await servers_collection.find({}, {"_id": 1}).to_list(None)]
+        except Exception as e:
+            logger.error(f"Error listing servers for analytics refresh: {e}")
+            return
+        
+        # One server at a time so the refresh never floods the database
+        for server_id in server_ids:
+            try:
+                await self._refresh_analytics(
+                    ("server", server_id, DEFAULT_TIME_PERIOD),
+                    lambda: AnalyticsService.get_server_stats(server_id, DEFAULT_TIME_PERIOD)
+                )
+                await self._refresh_analytics(
+                    ("leaderboard", server_id, "kills", 10, DEFAULT_TIME_PERIOD),
+                    lambda: AnalyticsService.get_leaderboard(server_id, "kills", 10, DEFAULT_TIME_PERIOD)
+                )
+            except Exception as e:
+                logger.error(f"Error refreshing analytics for server {server_id}: {e}")
+    
+    @refresh_default_analytics.before_loop
+    async def before_refresh_default_analytics(self):
+        await self.bot.wait_until_ready()
+        
+    async def _bounded(self, coro_factory):
+        """Run an AnalyticsService call once a concurrency slot is free"""
+        async with self._analytics_sem:
+            return await coro_factory()
+    
+    async def _cached_analytics(self, key, coro_factory):
+        """Get a cached AnalyticsService result, computing it under the concurrency bound"""
+        return await analytics_cache.get_or_compute(key, lambda: self._bounded(coro_factory))
+    
+    async def _refresh_analytics(self, key, coro_factory):
+        """Recompute an AnalyticsService result into the cache under the concurrency bound"""
+        return await analytics_cache.refresh(key, lambda: self._bounded(coro_factory))
+    
+    async def _search_players(self, db, player_name):
+        """
+        Find players whose name starts with the given text, reusing recent searches
+        
+        Args:
+            db: Database connection
+            player_name: Start of the player name, matched case-insensitively
+            
+        Returns:
+            tuple: Up to PLAYER_SEARCH_LIMIT + 1 (player_id, player_name) pairs
+        """
+        async def search():
+            players_collection = await db.get_collection("players")
+            # Anchored, escaped prefix pattern so the player_name index is scanned
+            # instead of every document; fetch one past the display limit to
+            # tell whether more matches exist
+            cursor = players_collection.find(
+                {"player_name": {"$regex": f"^{re.escape(player_name)}", "$options": "i"}},
+                {"player_name": 1, "player_id": 1, "_id": 0}
+            ).limit(PLAYER_SEARCH_LIMIT + 1)
+            return tuple((doc["player_id"], doc["player_name"]) async for doc in cursor)
+        
+        # Only the id/name pairs are kept, keyed on the lowercased search text
+        return await analytics_cache.get_or_compute(
+            ("player_search", player_name.lower()),
+            search
+        )
+    
+    async def _resolve_server(self, ctx, db, server_index):
+        """
+        Get the guild's server at a 1-based index, reusing the cached server list
+        
+        Args:
+            ctx: Command context
+            db: Database connection
+            server_index: 1-based index chosen by the user
+            
+        Returns:
+            dict or None: The selected server document, or None if an error was already sent
+        """
+        servers = await get_cached_guild_servers(db, ctx.guild.id)
+        return await self._select_server(ctx, servers, server_index)
+    
+    async def _select_server(self, ctx, servers, server_index):
+        """
+        Pick a server from an already fetched list, responding with an error if invalid
+        
+        Args:
+            ctx: Command context
+            servers: List of the guild's server documents
+            server_index: 1-based index chosen by the user
+            
+        Returns:
+            dict or None: The selected server document, or None if an error was already sent
+        """
+        if not servers:
+            await ctx.respond(embed=_restamp(_NO_SERVER_EMBED))
+            return None
+        
+        # Validate server index
+        if server_index < 1 or server_index > len(servers):
+            await ctx.respond(embed=_restamp(_invalid_index_embed(len(servers))))
+            return None
+        
+        # Adjust index for zero-based list
+        return servers[server_index - 1]
+        
+    def _build_player_embed(self, analytics, time_period):
+        """
+        Build the player analytics embed shared by the name and ID lookups
+        
+        Args:
+            analytics: Result of AnalyticsService.get_player_analytics
+            time_period: Number of days the analytics cover
+            
+        Returns:
+            discord.Embed: Formatted player analytics
+        """
+        embed = create_embed(
+            title=f"Player Analytics: {analytics['player_name']}",
+            description=f"Statistics for the past {time_period} days",
+            color=discord.Color.blue()
+        )
+        
+        # Add general stats
+        embed.add_field(
+            name="Performance Stats",
+            value=f"Kills: **{analytics['total_kills']}**\n"
+                  f"Deaths: **{analytics['total_deaths']}**\n"
+                  f"K/D Ratio: **{analytics['kd_ratio']}**\n"
+                  f"Suicides: **{analytics['suicide_count']}**\n"
+                  f"Average Kill Distance: **{analytics['avg_kill_distance']}m**",
+            inline=True
+        )
+        
+        # Add weapon stats
+        weapon_text = "\n".join(
+            f"{weapon['name']}: **{weapon['count']}**"
+            for weapon in analytics['favorite_weapons']
+        ) or "No weapon data available"
+        
+        embed.add_field(
+            name="Favorite Weapons",
+            value=weapon_text,
+            inline=True
+        )
+        
+        # Add activity hours
+        embed.add_field(
+            name="Active Hours",
+            value=_format_active_hours(analytics['active_hours']),
+            inline=True
+        )
+        
+        # Add nemesis/prey
+        nemesis_text = "None"
+        if analytics['nemesis']['id']:
+            nemesis_text = f"{analytics['nemesis']['name']} (Deaths: **{analytics['nemesis']['deaths']}**)"
+            
+        prey_text = "None"
+        if analytics['prey']['id']:
+            prey_text = f"{analytics['prey']['name']} (Kills: **{analytics['prey']['kills']}**)"
+        
+        embed.add_field(
+            name="Rivalry Info",
+            value=f"Nemesis: {nemesis_text}\nPrey: {prey_text}",
+            inline=False
+        )
+        
+        # Add frequent victims
+        victims_text = "\n".join(
+            f"{victim['name']}: **{victim['count']} kills**"
+            for victim in analytics['frequent_victims']
+        ) or "No frequent victims"
+        
+        embed.add_field(
+            name="Frequent Victims",
+            value=victims_text,
+            inline=True
+        )
+        
+        # Add frequent killers
+        killers_text = "\n".join(
+            f"{killer['name']}: **{killer['count']} kills**"
+            for killer in analytics['frequent_killers']
+        ) or "No frequent killers"
+        
+        embed.add_field(
+            name="Frequent Killers",
+            value=killers_text,
+            inline=True
+        )
+        
+        # Add improvement information
+        trend_emoji = "📈" if analytics['is_improving'] else "📉"
+        embed.add_field(
+            name="Improvement Trend",
+            value=f"Performance Change: **{analytics['improvement_percentage']}%** {trend_emoji}",
+            inline=False
+        )
+        
+        return embed
+        
     analytics = SlashCommandGroup(
         "analytics", 
         "Advanced statistics and analytics commands",
@@ -45,39 +314,30 @@ class AnalyticsCog(commands.Cog):
     async def server_analytics(
         self, 
         ctx: ApplicationContext, 
-        time_period: Option(int, "Time period in days", choices=[1, 7, 14, 30], default=7),
+        time_period: Option(int, "Time period in days", choices=[1, 7, 14, 30], default=DEFAULT_TIME_PERIOD),
         server_index: Option(int, "Index of server to use (if guild has multiple servers)", default=1)
     ):
         """Get detailed server analytics and statistics"""
         await ctx.defer()
         
         try:
-            db = await Database.get_instance()
+            db = Database.instance() or await Database.get_instance()
             
-            # Get server for this guild
-            servers = await Server.get_by_guild(db, str(ctx.guild.id))
-            if not servers:
-                return await ctx.respond(embed=error_embed(
-                    "No Server Found", 
-                    "This Discord server doesn't have any game servers configured."
-                ))
-            
-            # Validate server index
-            if server_index < 1 or server_index > len(servers):
-                return await ctx.respond(embed=error_embed(
-                    "Invalid Server Index",
-                    f"Please provide a server index between 1 and {len(servers)}."
-                ))
-            
-            # Adjust index for zero-based list
-            server = servers[server_index - 1]
+            # Get the selected server for this guild
+            server = await self._resolve_server(ctx, db, server_index)
+            if server is None:
+                return
             
             # Get server analytics
-            analytics = await AnalyticsService.get_server_stats(str(server._id), time_period)
+            server_id = str(server["_id"])
+            analytics = await self._cached_analytics(
+                ("server", server_id, time_period),
+                lambda: AnalyticsService.get_server_stats(server_id, time_period)
+            )
             
             # Create embed with analytics data
             embed = create_embed(
-                title=f"Server Analytics: {server.name}",
+                title=f"Server Analytics: {server['name']}",
                 description=f"Statistics for the past {time_period} days",
                 color=discord.Color.blue()
             )
@@ -95,13 +355,11 @@ class AnalyticsCog(commands.Cog):
             )
             
             # Add weapon stats
-            weapon_text = ""
-            for weapon in analytics['top_weapons']:
-                weapon_text += f"{weapon['name']}: **{weapon['count']}**\n"
-                
-            if not weapon_text:
-                weapon_text = "No weapon data available"
-                
+            weapon_text = "\n".join(
+                f"{weapon['name']}: **{weapon['count']}**"
+                for weapon in analytics['top_weapons']
+            ) or "No weapon data available"
+            
             embed.add_field(
                 name="Top Weapons",
                 value=weapon_text,
@@ -109,22 +367,9 @@ class AnalyticsCog(commands.Cog):
             )
             
             # Add activity stats
-            activity_text = ""
-            for hour in analytics['most_active_hours']:
-                # Convert 24h format to 12h format for readability
-                hour_12h = hour['hour'] % 12
-                if hour_12h == 0:
-                    hour_12h = 12
-                    
-                am_pm = "AM" if hour['hour'] < 12 else "PM"
-                activity_text += f"{hour_12h} {am_pm}: **{hour['count']} kills**\n"
-                
-            if not activity_text:
-                activity_text = "No activity data available"
-                
             embed.add_field(
                 name="Most Active Hours",
-                value=activity_text,
+                value=_format_active_hours(analytics['most_active_hours']),
                 inline=True
             )
             
@@ -154,56 +399,45 @@ class AnalyticsCog(commands.Cog):
     async def player_analytics(
         self, 
         ctx: ApplicationContext, 
-        player_name: Option(str, "Player name to search for (partial name search supported)"),
-        time_period: Option(int, "Time period in days", choices=[1, 7, 14, 30], default=7),
+        player_name: Option(str, "Player name to search for (start of the name is enough)"),
+        time_period: Option(int, "Time period in days", choices=[1, 7, 14, 30], default=DEFAULT_TIME_PERIOD),
         server_index: Option(int, "Index of server to use (if guild has multiple servers)", default=1)
     ):
         """Get detailed player analytics and statistics"""
         await ctx.defer()
         
         try:
-            db = await Database.get_instance()
+            db = Database.instance() or await Database.get_instance()
             
-            # Get server for this guild
-            servers = await Server.get_by_guild(db, str(ctx.guild.id))
-            if not servers:
-                return await ctx.respond(embed=error_embed(
-                    "No Server Found", 
-                    "This Discord server doesn't have any game servers configured."
-                ))
-            
-            # Validate server index
-            if server_index < 1 or server_index > len(servers):
-                return await ctx.respond(embed=error_embed(
-                    "Invalid Server Index",
-                    f"Please provide a server index between 1 and {len(servers)}."
-                ))
-            
-            # Adjust index for zero-based list
-            server = servers[server_index - 1]
+            # Get servers for this guild and find player by name (prefix match)
+            # concurrently, since neither depends on the other
+            servers, matches = await asyncio.gather(
+                get_cached_guild_servers(db, ctx.guild.id),
+                self._search_players(db, player_name)
+            )
             
-            # Find player by name (partial match)
-            players_collection = await db.get_collection("players")
-            regex_pattern = {"$regex": f".*{player_name}.*", "$options": "i"}
-            cursor = players_collection.find({"player_name": regex_pattern})
-            player_docs = await cursor.to_list(None)
+            server = await self._select_server(ctx, servers, server_index)
+            if server is None:
+                return
             
-            if not player_docs:
+            if not matches:
                 return await ctx.respond(embed=error_embed(
                     "Player Not Found",
-                    f"No players found with name containing '{player_name}'."
+                    f"No players found with name starting with '{player_name}'."
                 ))
             
             # If multiple matches, show selection
-            if len(player_docs) > 1:
-                selection_text = "Multiple players found. Please use one of these IDs with the `/analytics player_by_id` command:\n\n"
-                
-                for i, doc in enumerate(player_docs[:10]):  # Limit to top 10
-                    player = Player(**{**doc, "_id": doc.get("_id")})
-                    selection_text += f"**{i+1}.** {player.player_name} (ID: `{player.player_id}`)\n"
+            if len(matches) > 1:
+                parts = ["Multiple players found. Please use one of these IDs with the `/analytics player_by_id` command:\n"]
+                parts.extend(
+                    f"**{i+1}.** {match_name} (ID: `{match_id}`)"
+                    for i, (match_id, match_name) in enumerate(matches[:PLAYER_SEARCH_LIMIT])
+                )
                     
-                if len(player_docs) > 10:
-                    selection_text += f"\n_...and {len(player_docs) - 10} more matches_"
+                if len(matches) > PLAYER_SEARCH_LIMIT:
+                    parts.append("\n_...and more matches, try a longer name_")
+                
+                selection_text = "\n".join(parts)
                 
                 embed = create_embed(
                     title="Multiple Players Found",
@@ -214,120 +448,15 @@ class AnalyticsCog(commands.Cog):
                 return await ctx.respond(embed=embed)
             
             # Get player ID
-            player_doc = player_docs[0]
-            player_id = player_doc["player_id"]
+            player_id = matches[0][0]
             
             # Get player analytics
-            analytics = await AnalyticsService.get_player_analytics(player_id, time_period)
-            
-            # Create embed
-            embed = create_embed(
-                title=f"Player Analytics: {analytics['player_name']}",
-                description=f"Statistics for the past {time_period} days",
-                color=discord.Color.blue()
-            )
-            
-            # Add general stats
-            embed.add_field(
-                name="Performance Stats",
-                value=f"Kills: **{analytics['total_kills']}**\n"
-                      f"Deaths: **{analytics['total_deaths']}**\n"
-                      f"K/D Ratio: **{analytics['kd_ratio']}**\n"
-                      f"Suicides: **{analytics['suicide_count']}**\n"
-                      f"Average Kill Distance: **{analytics['avg_kill_distance']}m**",
-                inline=True
-            )
-            
-            # Add weapon stats
-            weapon_text = ""
-            for weapon in analytics['favorite_weapons']:
-                weapon_text += f"{weapon['name']}: **{weapon['count']}**\n"
-                
-            if not weapon_text:
-                weapon_text = "No weapon data available"
-                
-            embed.add_field(
-                name="Favorite Weapons",
-                value=weapon_text,
-                inline=True
-            )
-            
-            # Add activity hours
-            activity_text = ""
-            for hour in analytics['active_hours']:
-                # Convert 24h format to 12h format for readability
-                hour_12h = hour['hour'] % 12
-                if hour_12h == 0:
-                    hour_12h = 12
-                    
-                am_pm = "AM" if hour['hour'] < 12 else "PM"
-                activity_text += f"{hour_12h} {am_pm}: **{hour['count']} kills**\n"
-                
-            if not activity_text:
-                activity_text = "No activity data available"
-                
-            embed.add_field(
-                name="Active Hours",
-                value=activity_text,
-                inline=True
-            )
-            
-            # Add nemesis/prey
-            nemesis_text = "None"
-            if analytics['nemesis']['id']:
-                nemesis_text = f"{analytics['nemesis']['name']} (Deaths: **{analytics['nemesis']['deaths']}**)"
-                
-            prey_text = "None"
-            if analytics['prey']['id']:
-                prey_text = f"{analytics['prey']['name']} (Kills: **{analytics['prey']['kills']}**)"
-            
-            embed.add_field(
-                name="Rivalry Info",
-                value=f"Nemesis: {nemesis_text}\nPrey: {prey_text}",
-                inline=False
-            )
-            
-            # Add frequent victims
-            victims_text = ""
-            for victim in analytics['frequent_victims']:
-                victims_text += f"{victim['name']}: **{victim['count']} kills**\n"
-                
-            if not victims_text:
-                victims_text = "No frequent victims"
-                
-            embed.add_field(
-                name="Frequent Victims",
-                value=victims_text,
-                inline=True
+            analytics = await self._cached_analytics(
+                ("player", player_id, time_period),
+                lambda: AnalyticsService.get_player_analytics(player_id, time_period)
             )
             
-            # Add frequent killers
-            killers_text = ""
-            for killer in analytics['frequent_killers']:
-                killers_text += f"{killer['name']}: **{killer['count']} kills**\n"
-                
-            if not killers_text:
-                killers_text = "No frequent killers"
-                
-            embed.add_field(
-                name="Frequent Killers",
-                value=killers_text,
-                inline=True
-            )
-            
-            # Add improvement information
-            improvement_text = f"Performance Change: **{analytics['improvement_percentage']}%**"
-            
-            if analytics['is_improving']:
-                improvement_text += " 📈"
-            else:
-                improvement_text += " 📉"
-                
-            embed.add_field(
-                name="Improvement Trend",
-                value=improvement_text,
-                inline=False
-            )
+            embed = self._build_player_embed(analytics, time_period)
             
             await ctx.respond(embed=embed)
             
@@ -349,13 +478,13 @@ class AnalyticsCog(commands.Cog):
         self, 
         ctx: ApplicationContext, 
         player_id: Option(str, "Steam ID of the player"),
-        time_period: Option(int, "Time period in days", choices=[1, 7, 14, 30], default=7)
+        time_period: Option(int, "Time period in days", choices=[1, 7, 14, 30], default=DEFAULT_TIME_PERIOD)
     ):
         """Get detailed player analytics and statistics using exact Steam ID"""
         await ctx.defer()
         
         try:
-            db = await Database.get_instance()
+            db = Database.instance() or await Database.get_instance()
             
             # Check if player exists
             player = await Player.get_by_player_id(db, player_id)
@@ -366,116 +495,12 @@ class AnalyticsCog(commands.Cog):
                 ))
             
             # Get player analytics
-            analytics = await AnalyticsService.get_player_analytics(player_id, time_period)
-            
-            # Create embed
-            embed = create_embed(
-                title=f"Player Analytics: {analytics['player_name']}",
-                description=f"Statistics for the past {time_period} days",
-                color=discord.Color.blue()
+            analytics = await self._cached_analytics(
+                ("player", player_id, time_period),
+                lambda: AnalyticsService.get_player_analytics(player_id, time_period)
             )
             
-            # Add general stats
-            embed.add_field(
-                name="Performance Stats",
-                value=f"Kills: **{analytics['total_kills']}**\n"
-                      f"Deaths: **{analytics['total_deaths']}**\n"
-                      f"K/D Ratio: **{analytics['kd_ratio']}**\n"
-                      f"Suicides: **{analytics['suicide_count']}**\n"
-                      f"Average Kill Distance: **{analytics['avg_kill_distance']}m**",
-                inline=True
-            )
-            
-            # Add weapon stats
-            weapon_text = ""
-            for weapon in analytics['favorite_weapons']:
-                weapon_text += f"{weapon['name']}: **{weapon['count']}**\n"
-                
-            if not weapon_text:
-                weapon_text = "No weapon data available"
-                
-            embed.add_field(
-                name="Favorite Weapons",
-                value=weapon_text,
-                inline=True
-            )
-            
-            # Add activity hours
-            activity_text = ""
-            for hour in analytics['active_hours']:
-                # Convert 24h format to 12h format for readability
-                hour_12h = hour['hour'] % 12
-                if hour_12h == 0:
-                    hour_12h = 12
-                    
-                am_pm = "AM" if hour['hour'] < 12 else "PM"
-                activity_text += f"{hour_12h} {am_pm}: **{hour['count']} kills**\n"
-                
-            if not activity_text:
-                activity_text = "No activity data available"
-                
-            embed.add_field(
-                name="Active Hours",
-                value=activity_text,
-                inline=True
-            )
-            
-            # Add nemesis/prey
-            nemesis_text = "None"
-            if analytics['nemesis']['id']:
-                nemesis_text = f"{analytics['nemesis']['name']} (Deaths: **{analytics['nemesis']['deaths']}**)"
-                
-            prey_text = "None"
-            if analytics['prey']['id']:
-                prey_text = f"{analytics['prey']['name']} (Kills: **{analytics['prey']['kills']}**)"
-            
-            embed.add_field(
-                name="Rivalry Info",
-                value=f"Nemesis: {nemesis_text}\nPrey: {prey_text}",
-                inline=False
-            )
-            
-            # Add frequent victims
-            victims_text = ""
-            for victim in analytics['frequent_victims']:
-                victims_text += f"{victim['name']}: **{victim['count']} kills**\n"
-                
-            if not victims_text:
-                victims_text = "No frequent victims"
-                
-            embed.add_field(
-                name="Frequent Victims",
-                value=victims_text,
-                inline=True
-            )
-            
-            # Add frequent killers
-            killers_text = ""
-            for killer in analytics['frequent_killers']:
-                killers_text += f"{killer['name']}: **{killer['count']} kills**\n"
-                
-            if not killers_text:
-                killers_text = "No frequent killers"
-                
-            embed.add_field(
-                name="Frequent Killers",
-                value=killers_text,
-                inline=True
-            )
-            
-            # Add improvement information
-            improvement_text = f"Performance Change: **{analytics['improvement_percentage']}%**"
-            
-            if analytics['is_improving']:
-                improvement_text += " 📈"
-            else:
-                improvement_text += " 📉"
-                
-            embed.add_field(
-                name="Improvement Trend",
-                value=improvement_text,
-                inline=False
-            )
+            embed = self._build_player_embed(analytics, time_period)
             
             await ctx.respond(embed=embed)
             
@@ -497,39 +522,30 @@ class AnalyticsCog(commands.Cog):
         self, 
         ctx: ApplicationContext, 
         sort_by: Option(str, "Stat to sort by", choices=["kills", "kd", "distance"], default="kills"),
-        time_period: Option(int, "Time period in days (0 for all-time)", choices=[0, 1, 7, 14, 30], default=7),
+        time_period: Option(int, "Time period in days (0 for all-time)", choices=[0, 1, 7, 14, 30], default=DEFAULT_TIME_PERIOD),
         server_index: Option(int, "Index of server to use (if guild has multiple servers)", default=1)
     ):
         """Get server leaderboard with various sorting options"""
         await ctx.defer()
         
         try:
-            db = await Database.get_instance()
-            
-            # Get server for this guild
-            servers = await Server.get_by_guild(db, str(ctx.guild.id))
-            if not servers:
-                return await ctx.respond(embed=error_embed(
-                    "No Server Found", 
-                    "This Discord server doesn't have any game servers configured."
-                ))
-            
-            # Validate server index
-            if server_index < 1 or server_index > len(servers):
-                return await ctx.respond(embed=error_embed(
-                    "Invalid Server Index",
-                    f"Please provide a server index between 1 and {len(servers)}."
-                ))
+            db = Database.instance() or await Database.get_instance()
             
-            # Adjust index for zero-based list
-            server = servers[server_index - 1]
+            # Get the selected server for this guild
+            server = await self._resolve_server(ctx, db, server_index)
+            if server is None:
+                return
             
             # Get leaderboard data
             time_param = None if time_period == 0 else time_period
-            leaderboard = await AnalyticsService.get_leaderboard(str(server._id), sort_by, 10, time_param)
+            server_id = str(server["_id"])
+            leaderboard = await self._cached_analytics(
+                ("leaderboard", server_id, sort_by, 10, time_param),
+                lambda: AnalyticsService.get_leaderboard(server_id, sort_by, 10, time_param)
+            )
             
             # Create title based on sort and time period
-            title = f"Leaderboard: {server.name}"
+            title = f"Leaderboard: {server['name']}"
             if sort_by == "kills":
                 title += " (by Kills)"
             elif sort_by == "kd":
@@ -550,33 +566,23 @@ class AnalyticsCog(commands.Cog):
             )
             
             # Add leaderboard entries
-            leaderboard_text = ""
+            parts = []
             for i, entry in enumerate(leaderboard):
-                # Add emoji for top 3
-                prefix = ""
-                if i == 0:
-                    prefix = "🥇 "
-                elif i == 1:
-                    prefix = "🥈 "
-                elif i == 2:
-                    prefix = "🥉 "
-                else:
-                    prefix = f"**{i+1}.** "
-                
                 # Format entry based on sort type
-                entry_text = f"{prefix}{entry['player_name']}: "
-                
                 if sort_by == "kills":
-                    entry_text += f"**{entry['kills']} kills**, {entry['deaths']} deaths, K/D {entry['kd_ratio']}"
+                    stats = f"**{entry['kills']} kills**, {entry['deaths']} deaths, K/D {entry['kd_ratio']}"
                 elif sort_by == "kd":
-                    entry_text += f"**K/D {entry['kd_ratio']}**, {entry['kills']} kills, {entry['deaths']} deaths"
+                    stats = f"**K/D {entry['kd_ratio']}**, {entry['kills']} kills, {entry['deaths']} deaths"
                 elif sort_by == "distance":
-                    entry_text += f"**{entry.get('avg_distance', 0)}m avg**, {entry['kills']} kills"
+                    stats = f"**{entry.get('avg_distance', 0)}m avg**, {entry['kills']} kills"
+                else:
+                    stats = ""
                 
-                leaderboard_text += f"{entry_text}\n"
+                # Emoji for top 3, numbered rank after that
+                prefix = _RANK_PREFIX[i] if i < len(_RANK_PREFIX) else f"**{i+1}.** "
+                parts.append(f"{prefix}{entry['player_name']}: {stats}")
             
-            if not leaderboard_text:
-                leaderboard_text = "No player data available for this time period"
+            leaderboard_text = "\n".join(parts) or "No player data available for this time period"
                 
             embed.add_field(
                 name="Top Players",
@@ -605,16 +611,19 @@ class AnalyticsCog(commands.Cog):
         self, 
         ctx: ApplicationContext, 
         faction_id: Option(str, "ID of the faction"),
-        time_period: Option(int, "Time period in days", choices=[1, 7, 14, 30], default=7)
+        time_period: Option(int, "Time period in days", choices=[1, 7, 14, 30], default=DEFAULT_TIME_PERIOD)
     ):
         """Get detailed analytics for a specific faction"""
         await ctx.defer()
         
         try:
-            db = await Database.get_instance()
+            db = Database.instance() or await Database.get_instance()
             
             # Get faction analytics
-            analytics = await AnalyticsService.get_faction_analytics(faction_id, time_period)
+            analytics = await self._cached_analytics(
+                ("faction", faction_id, time_period),
+                lambda: AnalyticsService.get_faction_analytics(faction_id, time_period)
+            )
             
             if "error" in analytics:
                 return await ctx.respond(embed=error_embed(
@@ -641,13 +650,11 @@ class AnalyticsCog(commands.Cog):
             )
             
             # Add top performers
-            performers_text = ""
-            for player in analytics['top_performers']:
-                performers_text += f"{player['player_name']}: **{player['kills']} kills**, K/D {player['kd_ratio']}\n"
-                
-            if not performers_text:
-                performers_text = "No performer data available"
-                
+            performers_text = "\n".join(
+                f"{player['player_name']}: **{player['kills']} kills**, K/D {player['kd_ratio']}"
+                for player in analytics['top_performers']
+            ) or "No performer data available"
+            
             embed.add_field(
                 name="Top Members",
                 value=performers_text,
@@ -655,13 +662,11 @@ class AnalyticsCog(commands.Cog):
             )
             
             # Add top weapons
-            weapons_text = ""
-            for weapon in analytics['top_weapons']:
-                weapons_text += f"{weapon['name']}: **{weapon['count']}**\n"
-                
-            if not weapons_text:
-                weapons_text = "No weapon data available"
-                
+            weapons_text = "\n".join(
+                f"{weapon['name']}: **{weapon['count']}**"
+                for weapon in analytics['top_weapons']
+            ) or "No weapon data available"
+            
             embed.add_field(
                 name="Faction Weapons",
                 value=weapons_text,
@@ -669,14 +674,12 @@ class AnalyticsCog(commands.Cog):
             )
             
             # Add faction rivalries
-            rivals_text = ""
-            for rival in analytics['rivalries']:
-                rivals_text += f"**{rival['faction_name']}**: "
-                rivals_text += f"{rival['kills_against']} kills, {rival['deaths_to']} deaths, K/D {rival['kd_ratio']}\n"
-                
-            if not rivals_text:
-                rivals_text = "No rivalry data available"
-                
+            rivals_text = "\n".join(
+                f"**{rival['faction_name']}**: "
+                f"{rival['kills_against']} kills, {rival['deaths_to']} deaths, K/D {rival['kd_ratio']}"
+                for rival in analytics['rivalries']
+            ) or "No rivalry data available"
+            
             embed.add_field(
                 name="Faction Rivalries",
                 value=rivals_text,
@@ -705,11 +708,11 @@ class AnalyticsCog(commands.Cog):
         await ctx.defer()
         
         try:
-            db = await Database.get_instance()
+            db = Database.instance() or await Database.get_instance()
             
             # Get factions from database
             factions_collection = await db.get_collection("factions")
-            cursor = factions_collection.find()
+            cursor = factions_collection.find({}, {"name": 1, "_id": 1}).limit(FACTION_LIST_LIMIT)
             factions = await cursor.to_list(None)
             
             if not factions:
@@ -725,11 +728,18 @@ class AnalyticsCog(commands.Cog):
                 color=discord.Color.dark_green()
             )
             
-            # Add factions to embed
-            factions_text = ""
+            # Add factions to embed, stopping before Discord's field length limit
+            lines = []
+            length = 0
             for faction in factions:
-                factions_text += f"**{faction['name']}** (ID: `{faction['_id']}`)\n"
-                
+                line = f"**{faction['name']}** (ID: `{faction['_id']}`)"
+                if length + len(line) + 1 > EMBED_FIELD_LIMIT - len(FACTION_LIST_MORE):
+                    lines.append(FACTION_LIST_MORE)
+                    break
+                lines.append(line)
+                length += len(line) + 1
+            factions_text = "\n".join(lines)
+            
             embed.add_field(
                 name="Available Factions",
                 value=factions_text,
@@ -2,12 +2,70 @@ import discord
 from discord.ext import commands, tasks
 import logging
 import asyncio
+from collections import defaultdict
+from bson.objectid import ObjectId
+from pymongo.errors import OperationFailure
 from database.connection import Database
-from database.models import Server, GuildConfig, ConnectionEvent
-from utils.embeds import create_connection_embed
+from database.models import ConnectionEvent
+from utils.embeds import create_player_connection_embed
+from utils.guild_isolation import get_cached_guild_servers
 
 logger = logging.getLogger('deadside_bot.cogs.connection')
 
+# MongoDB error code for "$changeStream is only supported on replica sets"
+CHANGE_STREAM_UNSUPPORTED = 40573
+
+# Connection event fields shown by /connections list
+CONNECTION_LIST_PROJECTION = {
+    "event_type": 1, "timestamp": 1, "player_name": 1, "reason": 1, "server_id": 1
+}
+
+# Connection event fields needed to build a ConnectionEvent for notifications
+CONNECTION_EVENT_FIELDS = ("timestamp", "player_id", "player_name", "server_id", "event_type", "reason")
+CONNECTION_EVENT_PROJECTION = {field: 1 for field in CONNECTION_EVENT_FIELDS}
+
+# Maximum number of new connection events fetched per server per polling cycle
+POLL_BATCH_LIMIT = 100
+
+# Poll interval bounds (in seconds); the interval grows while idle and resets on activity
+POLL_INTERVAL_MIN = 2.0
+POLL_INTERVAL_MAX = 60.0
+POLL_BACKOFF_FACTOR = 1.5
+
+# Watermark for a server with no events yet, so every later event counts as new
+NO_EVENTS_WATERMARK = ObjectId("0" * 24)
+
+# Maximum number of connection notifications being sent to Discord at once
+MAX_CONCURRENT_SENDS = 5
+
+# Discord allows at most 10 embeds per message
+EMBEDS_PER_MESSAGE = 10
+
+# Display names for the known connection event types
+_EVENT_TYPE_DISPLAY = {"connect": "Connect", "disconnect": "Disconnect", "kick": "Kick"}
+
+# Timestamp format used in /connections list
+_TS_FMT = "%Y-%m-%d %H:%M:%S"
+
+def _connection_field(conn):
+    """
+    Format a connection event as an embed field name and value
+    
+    Args:
+        conn: Connection event document
+        
+    Returns:
+        tuple: (field name, field value)
+    """
+    event_type = conn["event_type"]
+    display = _EVENT_TYPE_DISPLAY.get(event_type) or event_type.capitalize()
+    value = f"Time: {conn['timestamp'].strftime(_TS_FMT)}"
+    
+    if event_type == "kick":
+        value = f"{value}\nReason: {conn.get('reason', 'Unknown')}"
+    
+    return f"{display}: {conn['player_name']}", value
+
 # Create slash command group
 connection_group = discord.SlashCommandGroup(
     name="connections",
@@ -23,6 +81,14 @@ class ConnectionCommands(commands.Cog):
         self.bot = bot
         self.db = getattr(bot, 'db', None)  # Get db from bot if available
         self.server_trackers = {}
+        # Polling task, started only if change streams aren't available
+        self._global_tracker_task = None
+        # Strong references to background tasks, so they aren't garbage collected mid-run
+        self._bg_tasks = set()
+        # connection_events collection handle, looked up on first use
+        self._conn_events = None
+        # Bounds concurrent notification sends to stay within Discord rate limits
+        self._send_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
         # Add the connection command group to this cog
         self.connection_group = connection_group
         # We'll initialize trackers after the cog is fully loaded, not during __init__
@@ -30,7 +96,34 @@ class ConnectionCommands(commands.Cog):
     async def cog_load(self):
         """Called when the cog is loaded. Safe to use async code here."""
         # Start tracking after a short delay to ensure everything is ready
-        self.bot.loop.create_task(self.initialize_connection_trackers())
+        self._spawn(self.initialize_connection_trackers())
+    
+    def cog_unload(self):
+        """Stop the change stream and trackers when the cog is unloaded"""
+        for task in list(self._bg_tasks):
+            task.cancel()
+    
+    def _spawn(self, coro, *, name=None):
+        """
+        Run a coroutine as a background task owned by this cog
+        
+        Args:
+            coro: Coroutine to run
+            name: Optional task name
+            
+        Returns:
+            asyncio.Task: The started task
+        """
+        task = asyncio.create_task(coro, name=name)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+        return task
+        
+    async def _get_connection_events(self):
+        """Get the connection_events collection, looking it up only once"""
+        if self._conn_events is None:
+            self._conn_events = await self.db.get_collection("connection_events")
+        return self._conn_events
         
     # This function is needed to expose the commands to the bot
     def get_commands(self):
@@ -49,35 +142,75 @@ class ConnectionCommands(commands.Cog):
             # Get all guild configs with connection channels
             collection = await self.db.get_collection("guild_configs")
             cursor = collection.find(
-                # MongoDB-style query
-                {} # Get all configs, we'll filter in Python
+                {"connection_channel": {"$ne": None}},
+                projection={"guild_id": 1, "connection_channel": 1}
             )
             configs = await cursor.to_list(None)
-            # Filter configs with a connection channel
-            configs = [config for config in configs if config.get("connection_channel") is not None]
+            
+            # Get servers for every configured guild in one query
+            servers_by_guild = await self._servers_for_guilds(config["guild_id"] for config in configs)
             
             for config in configs:
                 guild_id = config["guild_id"]
                 channel_id = config["connection_channel"]
                 
-                # Get servers for this guild
-                servers = await Server.get_by_guild(self.db, guild_id)
-                
-                for server in servers:
-                    self.server_trackers[str(server._id)] = {
+                for server in servers_by_guild[str(guild_id)]:
+                    server_id = server["_id"]
+                    self.server_trackers[str(server_id)] = {
+                        "server_id": server_id,
+                        "server_name": server["name"],
                         "guild_id": guild_id,
                         "channel_id": channel_id,
                         "last_connection_id": None
                     }
-                    
-                    # Start the tracker
-                    self.bot.loop.create_task(self.track_server_connections(server._id, channel_id))
+            
+            # One change stream delivers events for every tracked server
+            self._spawn(self.watch_connections(), name="connection_change_stream")
             
             logger.info(f"Initialized connection trackers for {len(self.server_trackers)} servers")
                 
         except Exception as e:
             logger.error(f"Error initializing connection trackers: {e}")
     
+    async def _servers_for_guilds(self, guild_ids):
+        """
+        Get the servers of several guilds with a single query
+        
+        Args:
+            guild_ids: Iterable of Discord guild IDs
+            
+        Returns:
+            defaultdict: Guild ID (as a string) -> list of server documents
+        """
+        servers_by_guild = defaultdict(list)
+        
+        # Servers store the guild ID as a string
+        guild_keys = list({str(guild_id) for guild_id in guild_ids})
+        if not guild_keys:
+            return servers_by_guild
+        
+        collection = await self.db.get_collection("servers")
+        cursor = collection.find({"guild_id": {"$in": guild_keys}}, projection={"guild_id": 1, "name": 1})
+        for server in await cursor.to_list(None):
+            servers_by_guild[server["guild_id"]].append(server)
+        
+        return servers_by_guild
+    
+    async def _set_connection_channel(self, guild_id, channel_id):
+        """
+        Set or clear the connection channel in a guild's config
+        
+        Args:
+            guild_id: Discord guild ID
+            channel_id: Discord channel ID, or None to disable notifications
+        """
+        collection = await self.db.get_collection("guild_configs")
+        await collection.update_one(
+            {"guild_id": guild_id},
+            {"$set": {"connection_channel": channel_id}},
+            upsert=True
+        )
+    
     @connection_group.command(
         name="channel",
         description="Set the channel for connection notifications",
@@ -105,28 +238,22 @@ class ConnectionCommands(commands.Cog):
                 channel = ctx.channel
             
             # Update guild config
-            guild_config = await GuildConfig.get_or_create(self.db, ctx.guild.id)
-            guild_config.connection_channel = channel.id
-            await guild_config.update(self.db)
+            await self._set_connection_channel(ctx.guild.id, channel.id)
             
             # Update trackers for all servers in this guild
-            servers = await Server.get_by_guild(self.db, ctx.guild.id)
+            servers = await get_cached_guild_servers(self.db, ctx.guild.id)
             
             for server in servers:
+                server_id = server["_id"]
+                
                 # Update tracker info
-                self.server_trackers[str(server._id)] = {
+                self.server_trackers[str(server_id)] = {
+                    "server_id": server_id,
+                    "server_name": server["name"],
                     "guild_id": ctx.guild.id,
                     "channel_id": channel.id,
                     "last_connection_id": None
                 }
-                
-                # Start the tracker if not already running
-                if not any(task.get_name() == f"connection_tracker_{server._id}" 
-                          for task in asyncio.all_tasks()):
-                    self.bot.loop.create_task(
-                        self.track_server_connections(server._id, channel.id),
-                        name=f"connection_tracker_{server._id}"
-                    )
             
             await ctx.respond(f"✅ Connection notifications will now be sent to {channel.mention}")
                 
@@ -150,16 +277,13 @@ class ConnectionCommands(commands.Cog):
                 return
                 
             # Update guild config
-            guild_config = await GuildConfig.get_or_create(self.db, ctx.guild.id)
-            guild_config.connection_channel = None
-            await guild_config.update(self.db)
+            await self._set_connection_channel(ctx.guild.id, None)
             
             # Remove trackers for all servers in this guild
-            servers = await Server.get_by_guild(self.db, ctx.guild.id)
+            servers = await get_cached_guild_servers(self.db, ctx.guild.id)
             
             for server in servers:
-                if str(server._id) in self.server_trackers:
-                    del self.server_trackers[str(server._id)]
+                self.server_trackers.pop(str(server["_id"]), None)
             
             await ctx.respond("✅ Connection notifications have been disabled.")
                 
@@ -197,47 +321,37 @@ class ConnectionCommands(commands.Cog):
             
             if server_name:
                 # Get connections for specific server
-                servers = await Server.get_by_guild(self.db, ctx.guild.id)
-                server = next((s for s in servers if s.name.lower() == server_name.lower()), None)
+                servers = await get_cached_guild_servers(self.db, ctx.guild.id)
+                server = next((s for s in servers if s["name"].lower() == server_name.lower()), None)
                 
                 if not server:
                     await ctx.respond(f"⚠️ Server '{server_name}' not found. Use `/server list` to see all configured servers.")
                     return
                 
                 # Get recent connections
-                collection = await self.db.get_collection("connection_events")
-                cursor = collection.find({"server_id": server._id})
+                collection = await self._get_connection_events()
+                cursor = collection.find(
+                    {"server_id": server["_id"]}, projection=CONNECTION_LIST_PROJECTION
+                ).sort("_id", -1).limit(limit).batch_size(limit)
                 connections = await cursor.to_list(limit)
                 
                 # Create embed
                 embed = discord.Embed(
-                    title=f"Recent Connections for {server.name}",
+                    title=f"Recent Connections for {server['name']}",
                     description=f"Last {len(connections)} connection events",
                     color=discord.Color.blue()
                 )
                 
+                add_field = embed.add_field
                 for conn in connections:
-                    event_type = conn["event_type"].capitalize()
-                    timestamp = conn["timestamp"].strftime("%Y-%m-%d %H:%M:%S")
-                    player_name = conn["player_name"]
-                    
-                    if conn["event_type"] == "kick":
-                        embed.add_field(
-                            name=f"{event_type}: {player_name}",
-                            value=f"Time: {timestamp}\nReason: {conn.get('reason', 'Unknown')}",
-                            inline=False
-                        )
-                    else:
-                        embed.add_field(
-                            name=f"{event_type}: {player_name}",
-                            value=f"Time: {timestamp}",
-                            inline=True
-                        )
+                    name, value = _connection_field(conn)
+                    # Kicks carry a reason, so give them a full-width field
+                    add_field(name=name, value=value, inline=conn["event_type"] != "kick")
                 
                 await ctx.respond(embed=embed)
             else:
                 # Get connections for all servers
-                servers = await Server.get_by_guild(self.db, ctx.guild.id)
+                servers = await get_cached_guild_servers(self.db, ctx.guild.id)
                 
                 if not servers:
                     await ctx.respond("No servers have been configured yet. Use `/server add` to add a server.")
@@ -250,34 +364,25 @@ class ConnectionCommands(commands.Cog):
                     color=discord.Color.blue()
                 )
                 
-                # Get recent connections for each server
+                # Get recent connections for every server concurrently
+                events_by_server = await self._recent_connections_by_server(
+                    [server["_id"] for server in servers], limit
+                )
+                
                 for server in servers:
-                    collection = await self.db.get_collection("connection_events")
-                    cursor = collection.find({"server_id": server._id})
-                    connections = await cursor.to_list(limit)
+                    connections = events_by_server.get(server["_id"], [])
                     
                     if connections:
                         combined_embed.add_field(
-                            name=f"📊 {server.name} ({len(connections)} events)",
+                            name=f"📊 {server['name']} ({len(connections)} events)",
                             value="Server connection events",
                             inline=False
                         )
                         
+                        add_field = combined_embed.add_field
                         for conn in connections:
-                            event_type = conn["event_type"].capitalize()
-                            timestamp = conn["timestamp"].strftime("%Y-%m-%d %H:%M:%S")
-                            player_name = conn["player_name"]
-                            
-                            if conn["event_type"] == "kick":
-                                field_value = f"Time: {timestamp}\nReason: {conn.get('reason', 'Unknown')}"
-                            else:
-                                field_value = f"Time: {timestamp}"
-                                
-                            combined_embed.add_field(
-                                name=f"{event_type}: {player_name}",
-                                value=field_value,
-                                inline=True
-                            )
+                            name, value = _connection_field(conn)
+                            add_field(name=name, value=value, inline=True)
                 
                 await ctx.respond(embed=combined_embed)
                 
@@ -285,114 +390,258 @@ class ConnectionCommands(commands.Cog):
             logger.error(f"Error listing connections: {e}")
             await ctx.respond(f"⚠️ An error occurred: {e}")
     
-    async def track_server_connections(self, server_id, channel_id):
+    async def _recent_connections_by_server(self, server_ids, limit):
         """
-        Background task to track new connections for a server and send to channel
+        Get the most recent connection events of several servers concurrently
+        
+        Each server gets its own query on the (server_id, _id) index, so only
+        `limit` events are read per server.
+        
+        Args:
+            server_ids: MongoDB ObjectIds of the servers
+            limit: Maximum number of events per server
+            
+        Returns:
+            dict: Server ID -> list of event documents, newest first
+        """
+        collection = await self._get_connection_events()
+        
+        async def recent(server_id):
+            cursor = collection.find(
+                {"server_id": server_id}, projection=CONNECTION_LIST_PROJECTION
+            ).sort("_id", -1).limit(limit).batch_size(limit)
+            return await cursor.to_list(limit)
+        
+        results = await asyncio.gather(*(recent(server_id) for server_id in server_ids))
+        return dict(zip(server_ids, results))
+    
+    async def refresh_server_name(self, server_id):
+        """
+        Reload the server name shown in a tracked server's notifications (e.g. after a rename)
         
         Args:
             server_id: MongoDB ObjectId of the server
-            channel_id: Discord channel ID to send connection messages
         """
-        # Ensure we don't start multiple trackers for the same server
-        task_name = f"connection_tracker_{server_id}"
-        for task in asyncio.all_tasks():
-            if task.get_name() == task_name and task != asyncio.current_task():
-                logger.debug(f"Connection tracker for server {server_id} already running")
-                return
+        tracker = self.server_trackers.get(str(server_id))
+        if tracker is None:
+            return
         
-        # Set task name for identification
-        asyncio.current_task().set_name(task_name)
+        collection = await self.db.get_collection("servers")
+        server = await collection.find_one({"_id": server_id}, projection={"name": 1})
+        tracker["server_name"] = server["name"] if server else "Unknown Server"
+    
+    async def _send_connections(self, channel, connections, server_name):
+        """
+        Send the embeds for a batch of connection events, up to 10 per message
         
-        try:
-            # Ensure we have a database instance
-            if not self.db:
-                logger.error(f"Database instance not available in track_server_connections for server {server_id}")
-                return
-            
-            # Get initial last connection ID
-            if str(server_id) in self.server_trackers and self.server_trackers[str(server_id)]["last_connection_id"]:
-                last_connection_id = self.server_trackers[str(server_id)]["last_connection_id"]
-            else:
-                # Get the most recent connection for this server
-                collection = await self.db.get_collection("connection_events")
-                cursor = collection.find({"server_id": server_id})
-                latest_connection = await cursor.to_list(1)
-                
-                if latest_connection:
-                    last_connection_id = latest_connection[0]["_id"]
+        Args:
+            channel: Discord channel to send the embeds to
+            connections: Connection event documents
+            server_name: Name of the server the events belong to
+        """
+        embeds = [
+            create_player_connection_embed(ConnectionEvent(**conn_data), server_name)
+            for conn_data in connections
+        ]
+        
+        # Messages to one channel go out in order, so events aren't posted out of sequence
+        for i in range(0, len(embeds), EMBEDS_PER_MESSAGE):
+            chunk = embeds[i:i + EMBEDS_PER_MESSAGE]
+            async with self._send_semaphore:
+                if len(chunk) == 1:
+                    await channel.send(embed=chunk[0])
                 else:
-                    last_connection_id = None
-                
-                # Update tracker
-                if str(server_id) in self.server_trackers:
-                    self.server_trackers[str(server_id)]["last_connection_id"] = last_connection_id
+                    await channel.send(embeds=chunk)
+    
+    async def watch_connections(self):
+        """
+        Background task that sends connection events to their channels as they are inserted
+        
+        Change streams need a replica set; on a standalone MongoDB this falls back
+        to polling every tracked server with poll_connections.
+        """
+        try:
+            collection = await self._get_connection_events()
+            pipeline = [
+                {"$match": {"operationType": "insert"}},
+                {"$project": {
+                    "fullDocument._id": 1,
+                    **{f"fullDocument.{field}": 1 for field in CONNECTION_EVENT_FIELDS}
+                }}
+            ]
+            resume_token = None
             
             while True:
                 try:
-                    # Check if tracker still exists (could be removed if disabled)
-                    if str(server_id) not in self.server_trackers:
-                        logger.debug(f"Connection tracker for server {server_id} was disabled")
-                        return
-                    
-                    # Get channel
-                    channel = self.bot.get_channel(channel_id)
-                    if not channel:
-                        logger.warning(f"Could not find channel {channel_id} for connections")
+                    async with collection.watch(pipeline, resume_after=resume_token) as stream:
+                        async for change in stream:
+                            conn_data = change["fullDocument"]
+                            tracker = self.server_trackers.get(str(conn_data.get("server_id")))
+                            if tracker is not None:
+                                await self._dispatch_connections(tracker, [conn_data])
+                            resume_token = stream.resume_token
+                
+                except OperationFailure as e:
+                    if e.code != CHANGE_STREAM_UNSUPPORTED:
+                        logger.error(f"Error in connection change stream: {e}")
                         await asyncio.sleep(60)
                         continue
                     
-                    # Get new connections
-                    query = {"server_id": server_id}
-                    # We can't use MongoDB-style operators in PostgreSQL
-                    # We'll filter results in Python after fetching
-                    
-                    # Get the collection and execute the query
-                    collection = await self.db.get_collection("connection_events")
-                    cursor = collection.find(query)
-                    all_connections = await cursor.to_list(100)  # Limit to avoid flooding
-                    
-                    # Filter connections that are newer than last_connection_id if needed
-                    if last_connection_id:
-                        new_connections = [
-                            conn for conn in all_connections 
-                            if conn.get("id", 0) > last_connection_id or conn.get("_id", 0) > last_connection_id
-                        ]
-                    else:
-                        new_connections = all_connections
+                    logger.info("Change streams not supported, polling connection events instead")
+                    self._global_tracker_task = self._spawn(self.poll_connections(), name="connection_poller")
+                    return
+                
+                except Exception as e:
+                    logger.error(f"Error in connection change stream: {e}")
+                    await asyncio.sleep(60)  # Longer sleep on error
+        
+        except asyncio.CancelledError:
+            logger.info("Connection change stream was cancelled")
+            return
+        except Exception as e:
+            logger.error(f"Fatal error in connection change stream: {e}")
+    
+    async def _dispatch_connections(self, tracker, connections):
+        """
+        Send new connection events to a tracked server's channel and advance its watermark
+        
+        Args:
+            tracker: Entry from server_trackers for the events' server
+            connections: Connection event documents, oldest first
+        """
+        channel = self.bot.get_channel(tracker["channel_id"])
+        if not channel:
+            # Skip past the events, so a deleted channel doesn't keep them pending forever
+            logger.warning(f"Could not find channel {tracker['channel_id']} for connections, skipping {len(connections)} events")
+            tracker["last_connection_id"] = connections[-1]["_id"]
+            return
+        
+        try:
+            await self._send_connections(channel, connections, tracker["server_name"])
+        except (discord.Forbidden, discord.NotFound) as e:
+            # Retrying can't succeed until the channel is fixed, so don't hold the events back
+            logger.warning(f"Cannot send connection events to channel {tracker['channel_id']}, skipping {len(connections)} events: {e}")
+        except Exception as e:
+            logger.error(f"Error sending connection events for server {tracker['server_id']}: {e}")
+            return
+        
+        tracker["last_connection_id"] = connections[-1]["_id"]
+    
+    async def _dispatch_channel(self, batches):
+        """
+        Send the new events of servers sharing a channel one server after another
+        
+        Args:
+            batches: List of (tracker, connection event documents) for the same channel
+        """
+        for tracker, connections in batches:
+            await self._dispatch_connections(tracker, connections)
+    
+    async def _init_watermarks(self, collection):
+        """
+        Set the starting watermark of trackers that don't have one yet to their newest event
+        
+        Args:
+            collection: connection_events collection
+        """
+        pending = {
+            tracker["server_id"]: tracker
+            for tracker in self.server_trackers.values()
+            if tracker["last_connection_id"] is None
+        }
+        if not pending:
+            return
+        
+        pipeline = [
+            {"$match": {"server_id": {"$in": list(pending)}}},
+            {"$sort": {"server_id": 1, "_id": -1}},
+            {"$group": {"_id": "$server_id", "last_id": {"$first": "$_id"}}}
+        ]
+        latest = {result["_id"]: result["last_id"] for result in await collection.aggregate(pipeline).to_list(None)}
+        
+        for server_id, tracker in pending.items():
+            tracker["last_connection_id"] = latest.get(server_id, NO_EVENTS_WATERMARK)
+    
+    async def _poll_server(self, collection, tracker):
+        """
+        Get the next page of a tracked server's connection events after its watermark
+        
+        Args:
+            collection: connection_events collection
+            tracker: Entry from server_trackers
+            
+        Returns:
+            list: Up to POLL_BATCH_LIMIT event documents, oldest first
+        """
+        cursor = collection.find(
+            {"server_id": tracker["server_id"], "_id": {"$gt": tracker["last_connection_id"]}},
+            projection=CONNECTION_EVENT_PROJECTION
+        ).sort("_id", 1).limit(POLL_BATCH_LIMIT).batch_size(POLL_BATCH_LIMIT)  # Limit to avoid flooding
+        return await cursor.to_list(POLL_BATCH_LIMIT)
+    
+    async def poll_connections(self):
+        """
+        Background task that polls new connection events for every tracked server
+        
+        Each server is paged from its own watermark, at most POLL_BATCH_LIMIT
+        events per cycle, so a busy server can't starve the others.
+        """
+        try:
+            collection = await self._get_connection_events()
+            interval = POLL_INTERVAL_MIN
+            
+            while True:
+                try:
+                    await self._init_watermarks(collection)
+                    new_connections = []
                     
-                    for conn_data in new_connections:
-                        # Create a ConnectionEvent object
-                        connection = ConnectionEvent(**{**conn_data, "_id": conn_data["_id"]})
+                    # Get connections newer than each server's last sent one, oldest first
+                    trackers = list(self.server_trackers.values())
+                    if trackers:
+                        pages = await asyncio.gather(*(
+                            self._poll_server(collection, tracker) for tracker in trackers
+                        ))
+                        by_server = {
+                            str(tracker["server_id"]): page
+                            for tracker, page in zip(trackers, pages)
+                            if page
+                        }
+                        new_connections = [conn_data for page in by_server.values() for conn_data in page]
                         
-                        # Get server info for the embed
-                        server = await Server.get_by_id(self.db, connection.server_id)
-                        server_name = server.name if server else "Unknown Server"
+                        # Trackers may have been disabled while the query ran
+                        by_channel = defaultdict(list)
+                        for key, connections in by_server.items():
+                            tracker = self.server_trackers.get(key)
+                            if tracker is not None:
+                                by_channel[tracker["channel_id"]].append((tracker, connections))
                         
-                        # Create and send embed
-                        embed = await create_connection_embed(connection, server_name)
-                        await channel.send(embed=embed)
+                        # Different channels are sent to concurrently, each one in order
+                        await asyncio.gather(*(
+                            self._dispatch_channel(batches) for batches in by_channel.values()
+                        ))
                         
-                        # Update last connection ID
-                        last_connection_id = connection._id
-                        if str(server_id) in self.server_trackers:
-                            self.server_trackers[str(server_id)]["last_connection_id"] = last_connection_id
+                        # Log the number of connections processed
+                        if new_connections:
+                            logger.debug(f"Processed {len(new_connections)} new connections for {len(by_server)} servers")
                     
-                    # Log the number of connections processed
+                    # Snap back to the shortest interval after activity, back off while idle
                     if new_connections:
-                        logger.debug(f"Processed {len(new_connections)} new connections for server {server_id}")
+                        interval = POLL_INTERVAL_MIN
+                    else:
+                        interval = min(POLL_INTERVAL_MAX, interval * POLL_BACKOFF_FACTOR)
                     
                     # Sleep before next check
-                    await asyncio.sleep(15)
+                    await asyncio.sleep(interval)
                 
                 except Exception as e:
-                    logger.error(f"Error in connection tracker for server {server_id}: {e}")
+                    logger.error(f"Error in connection poller: {e}")
                     await asyncio.sleep(60)  # Longer sleep on error
         
         except asyncio.CancelledError:
-            logger.info(f"Connection tracker for server {server_id} was cancelled")
+            logger.info("Connection poller was cancelled")
             return
         except Exception as e:
-            logger.error(f"Fatal error in connection tracker for server {server_id}: {e}")
+            logger.error(f"Fatal error in connection poller: {e}")
 
 def setup(bot):
     """Add the cog to the bot directly when loaded via extension"""
@@ -1,6 +1,8 @@
 import discord
 from discord.ext import commands, tasks
 import logging
+import asyncio
+import time
 from datetime import datetime
 from bson import ObjectId
 
@@ -11,6 +13,12 @@ from utils.premium import check_feature_access, get_tier_display_info
 
 logger = logging.getLogger('deadside_bot.factions')
 
+# How long (in seconds) a faction lookup is reused before querying again
+FACTION_CACHE_TTL = 60
+
+# Maximum number of cached faction lookups kept at once
+FACTION_CACHE_MAX_SIZE = 4096
+
 # Create a SlashCommandGroup for faction commands
 faction_group = discord.SlashCommandGroup(
     name="faction",
@@ -25,6 +33,8 @@ class FactionCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.db = getattr(bot, 'db', None)  # Get db from bot if available
+        # Maps (guild ID, lookup kind, value) -> (result, expires_at)
+        self._faction_cache = {}
     
     async def cog_load(self):
         """Called when the cog is loaded. Safe to use async code here."""
@@ -36,6 +46,115 @@ class FactionCommands(commands.Cog):
     # This function is needed to expose the commands to the bot
     def get_commands(self):
         return [faction_group]
+    
+    async def _cached_faction(self, key, coro_factory):
+        """
+        Get a faction lookup result, reusing it for FACTION_CACHE_TTL seconds
+        
+        Args:
+            key: Cache key, starting with the guild ID
+            coro_factory: Callable returning the coroutine that performs the lookup
+            
+        Returns:
+            The cached or freshly looked up result
+        """
+        now = time.monotonic()
+        entry = self._faction_cache.get(key)
+        if entry is not None and entry[1] > now:
+            return entry[0]
+        
+        value = await coro_factory()
+        
+        if len(self._faction_cache) >= FACTION_CACHE_MAX_SIZE:
+            for expired in [k for k, (_, expires_at) in self._faction_cache.items() if expires_at <= now]:
+                del self._faction_cache[expired]
+            # Dicts keep insertion order, so the first keys are the oldest
+            while len(self._faction_cache) >= FACTION_CACHE_MAX_SIZE:
+                del self._faction_cache[next(iter(self._faction_cache))]
+        
+        self._faction_cache[key] = (value, now + FACTION_CACHE_TTL)
+        return value
+    
+    def _invalidate_factions(self, guild_id):
+        """
+        Drop every cached faction lookup for a guild after its factions change
+        
+        Args:
+            guild_id: Discord guild ID
+        """
+        for key in [key for key in self._faction_cache if key[0] == guild_id]:
+            del self._faction_cache[key]
+    
+    async def _get_faction_by_name(self, db, name, guild_id):
+        """Cached Faction.get_by_name"""
+        return await self._cached_faction(
+            (guild_id, "name", name), lambda: Faction.get_by_name(db, name, guild_id)
+        )
+    
+    async def _get_faction_by_abbreviation(self, db, abbreviation, guild_id):
+        """Cached Faction.get_by_abbreviation"""
+        return await self._cached_faction(
+            (guild_id, "abbreviation", abbreviation.upper()),
+            lambda: Faction.get_by_abbreviation(db, abbreviation, guild_id)
+        )
+    
+    async def _get_faction_by_member(self, db, member_id, guild_id):
+        """Cached Faction.get_by_member"""
+        return await self._cached_faction(
+            (guild_id, "member", member_id), lambda: Faction.get_by_member(db, member_id, guild_id)
+        )
+    
+    async def _get_guild_factions(self, db, guild_id):
+        """Cached Faction.get_all_for_guild"""
+        return await self._cached_faction(
+            (guild_id, "all"), lambda: Faction.get_all_for_guild(db, guild_id)
+        )
+    
+    def _faction_role(self, guild, faction):
+        """
+        Get a faction's Discord role
+        
+        Args:
+            guild: Discord guild the faction belongs to
+            faction: Faction to get the role for
+            
+        Returns:
+            discord.Role: The role, or None if the faction has none or it was deleted
+        """
+        if faction.role_snowflake is None:
+            return None
+        return guild.get_role(faction.role_snowflake)
+    
+    async def _top_weapon(self, db, player_ids):
+        """
+        Get the weapon with the most non-suicide kills across a set of players
+        
+        Args:
+            db: Database connection
+            player_ids: Game player IDs to count kills for
+            
+        Returns:
+            str: Weapon name, or "None" if the players have no kills
+        """
+        if not player_ids:
+            return "None"
+        
+        try:
+            kills_collection = await db.get_collection("kills")
+            cursor = kills_collection.aggregate([
+                {"$match": {"killer_id": {"$in": player_ids}, "is_suicide": False}},
+                # Only the weapon is needed, so the killer_id index covers the scan
+                {"$project": {"weapon": 1, "_id": 0}},
+                {"$group": {"_id": {"$ifNull": ["$weapon", "Unknown"]}, "count": {"$sum": 1}}},
+                {"$sort": {"count": -1}},
+                {"$limit": 1}
+            ])
+            result = await cursor.to_list(1)
+        except Exception as e:
+            logger.error(f"Error retrieving weapon stats: {e}")
+            return "None"
+        
+        return result[0]["_id"] if result else "None"
         
     @faction_group.command(name="create", description="Create a new faction", contexts=[discord.InteractionContextType.guild], integration_types=[discord.IntegrationType.guild_install])
     @premium_tier_required(tier=1)
@@ -51,6 +170,10 @@ class FactionCommands(commands.Cog):
             await ctx.respond("⚠️ Abbreviation must be 3 characters or less.", ephemeral=True)
             return
             
+        # Normalize once; factions always store the abbreviation uppercased
+        abbreviation = abbreviation.upper()
+        author_id = str(ctx.author.id)
+            
         # Check if guild has permission to manage roles
         if not ctx.guild.me.guild_permissions.manage_roles:
             await ctx.respond("⚠️ I don't have permission to manage roles in this server. Please grant the 'Manage Roles' permission.", ephemeral=True)
@@ -63,18 +186,18 @@ class FactionCommands(commands.Cog):
             
         # Check if a faction with this name or abbreviation already exists
         db = self.bot.db
-        existing_faction = await Faction.get_by_name(db, name, ctx.guild.id)
+        existing_faction = await self._get_faction_by_name(db, name, ctx.guild.id)
         if existing_faction:
             await ctx.respond(f"⚠️ A faction with the name '{name}' already exists.", ephemeral=True)
             return
             
-        existing_faction = await Faction.get_by_abbreviation(db, abbreviation, ctx.guild.id)
+        existing_faction = await self._get_faction_by_abbreviation(db, abbreviation, ctx.guild.id)
         if existing_faction:
-            await ctx.respond(f"⚠️ A faction with the abbreviation '{abbreviation.upper()}' already exists.", ephemeral=True)
+            await ctx.respond(f"⚠️ A faction with the abbreviation '{abbreviation}' already exists.", ephemeral=True)
             return
             
         # Check if user is already in a faction
-        existing_member_faction = await Faction.get_by_member(db, str(ctx.author.id), ctx.guild.id)
+        existing_member_faction = await self._get_faction_by_member(db, author_id, ctx.guild.id)
         if existing_member_faction:
             await ctx.respond(f"⚠️ You are already a member of the faction '{existing_member_faction.name}'. Leave that faction first before creating a new one.", ephemeral=True)
             return
@@ -107,8 +230,10 @@ class FactionCommands(commands.Cog):
         # Update the user's nickname with the faction abbreviation
         try:
             current_name = ctx.author.display_name
-            if not current_name.startswith(f"{abbreviation.upper()}"):
-                new_nickname = f"{abbreviation.upper()} {current_name}"
+            prefix = f"{abbreviation} "
+            # Only edit when the separated prefix isn't already there
+            if not current_name.startswith(prefix):
+                new_nickname = prefix + current_name
                 if len(new_nickname) > 32:  # Discord nickname limit
                     new_nickname = new_nickname[:32]
                 await ctx.author.edit(nick=new_nickname)
@@ -123,10 +248,11 @@ class FactionCommands(commands.Cog):
             name=name,
             abbreviation=abbreviation,
             guild_id=ctx.guild.id,
-            leader_id=str(ctx.author.id),
-            members=[str(ctx.author.id)],
+            leader_id=author_id,
+            members=[author_id],
             role_id=str(faction_role.id)
         )
+        self._invalidate_factions(ctx.guild.id)
         
         # Create embedded message with faction info
         embed = create_faction_embed(faction, ctx.guild)
@@ -145,75 +271,48 @@ class FactionCommands(commands.Cog):
         
         # If no name provided, check if user is in a faction
         if not name:
-            faction = await Faction.get_by_member(db, str(ctx.author.id), ctx.guild.id)
+            faction = await self._get_faction_by_member(db, str(ctx.author.id), ctx.guild.id)
             if not faction:
                 await ctx.respond("⚠️ You are not in a faction. Please provide a faction name to view details.", ephemeral=True)
                 return
         else:
             # Try to find the faction by name
-            faction = await Faction.get_by_name(db, name, ctx.guild.id)
+            faction = await self._get_faction_by_name(db, name, ctx.guild.id)
             if not faction:
                 # Try by abbreviation
-                faction = await Faction.get_by_abbreviation(db, name, ctx.guild.id)
+                faction = await self._get_faction_by_abbreviation(db, name, ctx.guild.id)
                 
             if not faction:
                 await ctx.respond(f"⚠️ Faction '{name}' not found.", ephemeral=True)
                 return
         
-        await ctx.respond("⏳ Gathering faction statistics...", ephemeral=True)
+        # Stats take a few queries, so acknowledge the interaction first
+        await ctx.defer()
+        
+        # Get player stats for each member
+        member_players = await Player.get_by_discord_ids(db, faction.members)
+        players = [player for linked in member_players.values() for player in linked]
+        player_ids = [player.player_id for player in players]
         
         # Calculate member stats
         member_stats = {
-            "total_kills": 0,
-            "total_deaths": 0,
-            "weapon_counts": {}
+            "total_kills": sum(player.total_kills for player in players),
+            "total_deaths": sum(player.total_deaths for player in players)
         }
-        
-        # Get player stats for each member
-        for member_id in faction.members:
-            players = await Player.get_by_discord_id(db, member_id)
-            
-            if not players:
-                continue
-                
-            for player in players:
-                # Add to faction totals
-                member_stats["total_kills"] += player.total_kills
-                member_stats["total_deaths"] += player.total_deaths
-                
-                # Get detailed stats for this player
-                try:
-                    # Get kill data to find weapons
-                    kills_collection = await db.get_collection("kills")
-                    cursor = kills_collection.find({
-                        "killer_id": player.player_id,
-                        "is_suicide": False
-                    })
-                    
-                    async for kill in cursor:
-                        # Track weapon usage
-                        weapon = kill.get("weapon", "Unknown")
-                        if weapon in member_stats["weapon_counts"]:
-                            member_stats["weapon_counts"][weapon] += 1
-                        else:
-                            member_stats["weapon_counts"][weapon] = 1
-                except Exception as e:
-                    logger.error(f"Error processing member stats: {e}")
                     
         # Get top weapon used
-        top_weapon = sorted(member_stats["weapon_counts"].items(), key=lambda x: x[1], reverse=True)
-        member_stats["top_weapon"] = top_weapon[0][0] if top_weapon else "None"
+        member_stats["top_weapon"] = await self._top_weapon(db, player_ids)
         
         # Create faction embed
         embed = create_faction_embed(faction, ctx.guild, member_stats)
-        await ctx.respond(embed=embed)
+        await ctx.followup.send(embed=embed)
         
     @faction_group.command(name="list", description="List all factions in this server")
     @premium_tier_required(tier=1)
     async def list_factions(self, ctx):
         """List all factions in the current guild"""
         db = self.bot.db
-        factions = await Faction.get_all_for_guild(db, ctx.guild.id)
+        factions = await self._get_guild_factions(db, ctx.guild.id)
         
         if not factions:
             await ctx.respond("No factions have been created in this server yet.", ephemeral=True)
@@ -227,8 +326,6 @@ class FactionCommands(commands.Cog):
         )
         
         for faction in factions:
-            # Get the faction role if it exists
-            role = discord.utils.get(ctx.guild.roles, id=int(faction.role_id)) if faction.role_id else None
             # Add field for each faction
             embed.add_field(
                 name=f"{faction.name} [{faction.abbreviation}]",
@@ -247,19 +344,21 @@ class FactionCommands(commands.Cog):
         Only faction leaders can invite new members.
         """
         db = self.bot.db
+        author_id = str(ctx.author.id)
+        member_id = str(member.id)
         
         # Check if the user is a faction leader
-        faction = await Faction.get_by_member(db, str(ctx.author.id), ctx.guild.id)
+        faction = await self._get_faction_by_member(db, author_id, ctx.guild.id)
         if not faction:
             await ctx.respond("⚠️ You are not in a faction.", ephemeral=True)
             return
             
-        if faction.leader_id != str(ctx.author.id):
+        if faction.leader_id != author_id:
             await ctx.respond("⚠️ Only faction leaders can invite new members.", ephemeral=True)
             return
             
         # Check if the target member is already in a faction
-        member_faction = await Faction.get_by_member(db, str(member.id), ctx.guild.id)
+        member_faction = await self._get_faction_by_member(db, member_id, ctx.guild.id)
         if member_faction:
             await ctx.respond(f"⚠️ {member.display_name} is already a member of the faction '{member_faction.name}'.", ephemeral=True)
             return
@@ -274,70 +373,83 @@ class FactionCommands(commands.Cog):
             return
             
         # Get the faction role
-        faction_role = discord.utils.get(ctx.guild.roles, id=int(faction.role_id)) if faction.role_id else None
+        faction_role = self._faction_role(ctx.guild, faction)
         if not faction_role:
             await ctx.respond(f"⚠️ Faction role for '{faction.name}' not found. The role may have been deleted.", ephemeral=True)
             return
             
         # Add the member to the faction
-        faction.members.append(str(member.id))
-        await faction.update(db)
+        await faction.add_member(db, member_id)
+        self._invalidate_factions(ctx.guild.id)
+        
+        # Work out the nickname with the faction abbreviation, if it needs one
+        current_name = member.display_name
+        original_nick = member.nick
+        new_nickname = None
+        prefix = f"{faction.abbreviation} "
+        if not current_name.startswith(prefix):
+            # Discord nickname limited to 32 chars
+            new_nickname = (prefix + current_name)[:32]
+        
+        # Assign the role and nickname concurrently rather than one REST call after another
+        role_result, nick_result = await asyncio.gather(
+            member.add_roles(faction_role),
+            member.edit(nick=new_nickname) if new_nickname else asyncio.sleep(0),
+            return_exceptions=True
+        )
         
-        # Add the role to the member
-        try:
-            await member.add_roles(faction_role)
-        except Exception as e:
-            await ctx.respond(f"⚠️ Failed to assign faction role: {e}", ephemeral=True)
+        if isinstance(role_result, Exception):
+            await ctx.respond(f"⚠️ Failed to assign faction role: {role_result}", ephemeral=True)
             # Remove the member from the faction in the database
-            faction.members.remove(str(member.id))
-            await faction.update(db)
+            await faction.remove_member(db, member_id)
+            self._invalidate_factions(ctx.guild.id)
+            # Undo the prefixed nickname if it went through
+            if new_nickname and not isinstance(nick_result, Exception):
+                try:
+                    await member.edit(nick=original_nick)
+                except Exception as e:
+                    logger.error(f"Error restoring nickname: {e}")
             return
         
-        # Update the member's nickname with the faction abbreviation
-        try:
-            current_name = member.display_name
-            if not current_name.startswith(f"{faction.abbreviation}"):
-                new_nickname = f"{faction.abbreviation} {current_name}"
-                if len(new_nickname) > 32:  # Discord nickname limited to 32 chars
-                    new_nickname = new_nickname[:32]
-                await member.edit(nick=new_nickname)
-        except discord.Forbidden:
+        if isinstance(nick_result, discord.Forbidden):
             await ctx.respond(f"✅ {member.mention} has been added to the faction, but I couldn't update their nickname (insufficient permissions)", ephemeral=True)
-        except Exception as e:
-            await ctx.respond(f"✅ {member.mention} has been added to the faction, but I couldn't update their nickname: {e}", ephemeral=True)
-            
-        # Send success message
-        await ctx.respond(f"✅ {member.mention} has been added to the faction '{faction.name}'!")
-        
-        # Send a DM to the invited member
-        try:
-            await member.send(f"You have been invited to join the faction '{faction.name}' in {ctx.guild.name}!")
-        except:
-            # Silently ignore if we can't DM the member
-            pass
+        elif isinstance(nick_result, Exception):
+            await ctx.respond(f"✅ {member.mention} has been added to the faction, but I couldn't update their nickname: {nick_result}", ephemeral=True)
+            
+        # Send the success message and DM the invited member together,
+        # silently ignoring a member who can't be DMed
+        await asyncio.gather(
+            ctx.respond(f"✅ {member.mention} has been added to the faction '{faction.name}'!"),
+            member.send(f"You have been invited to join the faction '{faction.name}' in {ctx.guild.name}!"),
+            return_exceptions=True
+        )
         
     @faction_group.command(name="leave", description="Leave your current faction")
     @premium_tier_required(tier=1)
     async def leave_faction(self, ctx):
         """Leave your current faction"""
         db = self.bot.db
+        author_id = str(ctx.author.id)
         
         # Check if the user is in a faction
-        faction = await Faction.get_by_member(db, str(ctx.author.id), ctx.guild.id)
+        faction = await self._get_faction_by_member(db, author_id, ctx.guild.id)
         if not faction:
             await ctx.respond("⚠️ You are not in a faction.", ephemeral=True)
             return
             
         # If the user is the faction leader, they can't leave unless they're the only member
-        if faction.leader_id == str(ctx.author.id) and len(faction.members) > 1:
+        if faction.leader_id == author_id and len(faction.members) > 1:
             await ctx.respond("⚠️ As the faction leader, you can't leave the faction while there are other members. Either transfer leadership first using `/faction_transfer` or remove all members.", ephemeral=True)
             return
             
+        # Nickname prefix added when the user joined
+        prefix = f"{faction.abbreviation} "
+        
         # If they're the last member (and therefore the leader), delete the faction
-        if len(faction.members) == 1 and faction.leader_id == str(ctx.author.id):
+        if len(faction.members) == 1 and faction.leader_id == author_id:
             # Delete the faction role
             try:
-                faction_role = discord.utils.get(ctx.guild.roles, id=int(faction.role_id)) if faction.role_id else None
+                faction_role = self._faction_role(ctx.guild, faction)
                 if faction_role:
                     await faction_role.delete(reason=f"Faction '{faction.name}' deleted by last member")
             except Exception as e:
@@ -345,12 +457,13 @@ class FactionCommands(commands.Cog):
                 
             # Delete the faction from the database
             await faction.delete(db)
+            self._invalidate_factions(ctx.guild.id)
             
             # Reset the user's nickname
             try:
                 current_name = ctx.author.display_name
-                if current_name.startswith(f"{faction.abbreviation} "):
-                    new_nickname = current_name[len(faction.abbreviation)+1:]
+                if current_name.startswith(prefix):
+                    new_nickname = current_name[len(prefix):]
                     await ctx.author.edit(nick=new_nickname)
             except Exception as e:
                 logger.error(f"Error resetting nickname: {e}")
@@ -359,12 +472,12 @@ class FactionCommands(commands.Cog):
             return
             
         # Remove the member from the faction
-        faction.members.remove(str(ctx.author.id))
-        await faction.update(db)
+        await faction.remove_member(db, author_id)
+        self._invalidate_factions(ctx.guild.id)
         
         # Remove the faction role
         try:
-            faction_role = discord.utils.get(ctx.guild.roles, id=int(faction.role_id)) if faction.role_id else None
+            faction_role = self._faction_role(ctx.guild, faction)
             if faction_role:
                 await ctx.author.remove_roles(faction_role)
         except Exception as e:
@@ -373,8 +486,8 @@ class FactionCommands(commands.Cog):
         # Reset the user's nickname
         try:
             current_name = ctx.author.display_name
-            if current_name.startswith(f"{faction.abbreviation} "):
-                new_nickname = current_name[len(faction.abbreviation)+1:]
+            if current_name.startswith(prefix):
+                new_nickname = current_name[len(prefix):]
                 await ctx.author.edit(nick=new_nickname)
         except:
             pass
@@ -390,33 +503,38 @@ class FactionCommands(commands.Cog):
         Only faction leaders can remove members.
         """
         db = self.bot.db
+        author_id = str(ctx.author.id)
+        member_id = str(member.id)
         
         # Check if the user is a faction leader
-        faction = await Faction.get_by_member(db, str(ctx.author.id), ctx.guild.id)
+        faction = await self._get_faction_by_member(db, author_id, ctx.guild.id)
         if not faction:
             await ctx.respond("⚠️ You are not in a faction.", ephemeral=True)
             return
             
-        if faction.leader_id != str(ctx.author.id):
+        if faction.leader_id != author_id:
             await ctx.respond("⚠️ Only faction leaders can remove members.", ephemeral=True)
             return
             
         # Check if the target member is in the faction
-        if str(member.id) not in faction.members:
+        if member_id not in faction.members:
             await ctx.respond(f"⚠️ {member.display_name} is not a member of your faction.", ephemeral=True)
             return
             
         # Check if the target is the leader (can't remove yourself this way)
-        if str(member.id) == faction.leader_id:
+        if member_id == faction.leader_id:
             await ctx.respond("⚠️ You can't remove yourself as the faction leader. Use `/faction_leave` instead.", ephemeral=True)
             return
             
+        # Nickname prefix added when the member joined
+        prefix = f"{faction.abbreviation} "
+        
         # Remove the member from the faction
-        faction.members.remove(str(member.id))
-        await faction.update(db)
+        await faction.remove_member(db, member_id)
+        self._invalidate_factions(ctx.guild.id)
         
         try:
-            faction_role = discord.utils.get(ctx.guild.roles, id=int(faction.role_id)) if faction.role_id else None
+            faction_role = self._faction_role(ctx.guild, faction)
             if faction_role:
                 await member.remove_roles(faction_role)
         except Exception as e:
@@ -425,8 +543,8 @@ class FactionCommands(commands.Cog):
         # Reset the member's nickname
         try:
             current_name = member.display_name
-            if current_name.startswith(f"{faction.abbreviation} "):
-                new_nickname = current_name[len(faction.abbreviation)+1:]
+            if current_name.startswith(prefix):
+                new_nickname = current_name[len(prefix):]
                 await member.edit(nick=new_nickname)
         except:
             pass
@@ -449,30 +567,32 @@ class FactionCommands(commands.Cog):
         Only faction leaders can transfer leadership.
         """
         db = self.bot.db
+        author_id = str(ctx.author.id)
+        member_id = str(member.id)
         
         # Check if the user is in a faction
-        faction = await Faction.get_by_member(db, str(ctx.author.id), ctx.guild.id)
+        faction = await self._get_faction_by_member(db, author_id, ctx.guild.id)
         if not faction:
             await ctx.respond("⚠️ You are not in a faction.", ephemeral=True)
             return
             
-        if faction.leader_id != str(ctx.author.id):
+        if faction.leader_id != author_id:
             await ctx.respond("⚠️ Only faction leaders can transfer leadership.", ephemeral=True)
             return
             
         # Check if the target member is in the faction
-        if str(member.id) not in faction.members:
+        if member_id not in faction.members:
             await ctx.respond(f"⚠️ {member.display_name} is not a member of your faction.", ephemeral=True)
             return
             
         # Check if the target is already the leader
-        if str(member.id) == faction.leader_id:
+        if member_id == faction.leader_id:
             await ctx.respond(f"⚠️ {member.display_name} is already the faction leader.", ephemeral=True)
             return
             
         # Transfer leadership
-        faction.leader_id = str(member.id)
-        await faction.update(db)
+        await faction.set_leader(db, member_id)
+        self._invalidate_factions(ctx.guild.id)
             
         await ctx.respond(f"✅ Leadership of faction '{faction.name}' has been transferred to {member.mention}.")
         
@@ -496,90 +616,43 @@ class FactionCommands(commands.Cog):
         
         # If no name provided, check if user is in a faction
         if not name:
-            faction = await Faction.get_by_member(db, str(ctx.author.id), ctx.guild.id)
+            faction = await self._get_faction_by_member(db, str(ctx.author.id), ctx.guild.id)
             if not faction:
                 await ctx.respond("⚠️ You are not in a faction. Please provide a faction name to view stats.", ephemeral=True)
                 return
         else:
             # Try to find the faction by name
-            faction = await Faction.get_by_name(db, name, ctx.guild.id)
+            faction = await self._get_faction_by_name(db, name, ctx.guild.id)
             if not faction:
                 # Try by abbreviation
-                faction = await Faction.get_by_abbreviation(db, name, ctx.guild.id)
+                faction = await self._get_faction_by_abbreviation(db, name, ctx.guild.id)
                 
             if not faction:
                 await ctx.respond(f"⚠️ Faction '{name}' not found.", ephemeral=True)
                 return
         
-        # Notify that we're calculating stats
-        await ctx.respond(f"⏳ Calculating combined statistics for faction '{faction.name}'...", ephemeral=True)
-        
         # Get all members of the faction that have linked Discord accounts
         if not faction.members:
             await ctx.respond(f"⚠️ Faction '{faction.name}' has no members with linked game accounts.", ephemeral=True)
             return
-            
-        # Initialize faction stats
-        total_kills = 0
-        total_deaths = 0
-        weapon_counts = {}
-        member_stats = []
         
-        # Get player stats for each linked Discord account in the faction
-        for member_id in faction.members:
-            players = await Player.get_by_discord_id(db, member_id)
+        # Stats take a few queries, so acknowledge the interaction first
+        await ctx.defer()
             
-            if not players:
-                continue
-                
-            member_total_kills = 0
-            member_total_deaths = 0
-            
-            for player in players:
-                # Add to faction totals
-                total_kills += player.total_kills
-                total_deaths += player.total_deaths
-                member_total_kills += player.total_kills
-                member_total_deaths += player.total_deaths
-                
-                # Get detailed stats for this player
-                try:
-                    # Get kill data to find weapons
-                    kills_collection = await db.get_collection("kills")
-                    cursor = kills_collection.find({
-                        "killer_id": player.player_id,
-                        "is_suicide": False
-                    })
-                    
-                    async for kill in cursor:
-                        weapon = kill.get("weapon", "Unknown")
-                        if weapon in weapon_counts:
-                            weapon_counts[weapon] += 1
-                        else:
-                            weapon_counts[weapon] = 1
-                except Exception as e:
-                    logger.error(f"Error retrieving weapon stats: {e}")
-            
-            # Only add member to stats if they have activity
-            if member_total_kills > 0 or member_total_deaths > 0:
-                member_stats.append({
-                    "id": member_id,
-                    "kills": member_total_kills,
-                    "deaths": member_total_deaths,
-                    "kd": member_total_kills / max(1, member_total_deaths)
-                })
-        
-        # Sort weapons by usage count
-        top_weapons = sorted(weapon_counts.items(), key=lambda x: x[1], reverse=True)
+        # Get player stats for each linked Discord account in the faction
+        member_players = await Player.get_by_discord_ids(db, faction.members)
+        players = [player for linked in member_players.values() for player in linked]
+        player_ids = [player.player_id for player in players]
         
-        # Sort members by kills
-        member_stats.sort(key=lambda x: x["kills"], reverse=True)
+        # Faction totals
+        total_kills = sum(player.total_kills for player in players)
+        total_deaths = sum(player.total_deaths for player in players)
         
         # Calculate K/D ratio for the faction
         kd_ratio = total_kills / max(1, total_deaths)
         
         # Get top weapon name (or "None" if no weapons)
-        top_weapon = top_weapons[0][0] if top_weapons else "None"
+        top_weapon = await self._top_weapon(db, player_ids)
         
         # Create a simplified embed for the faction stats in the requested format
         embed = discord.Embed(
@@ -593,8 +666,54 @@ class FactionCommands(commands.Cog):
         )
         
         # Send the embed
-        await ctx.respond(embed=embed)
+        await ctx.followup.send(embed=embed)
         
+    async def _faction_leaderboard(self, db, guild_id, limit=5):
+        """
+        Get the factions with the most kills in a guild, with their combined member stats
+        
+        Args:
+            db: Database connection
+            guild_id: Discord guild ID
+            limit: Number of factions to return
+            
+        Returns:
+            list: Dicts with faction name, abbreviation, kills, deaths, K/D, top weapon and member count
+        """
+        factions_collection = await db.get_collection("factions")
+        cursor = factions_collection.aggregate([
+            {"$match": {"guild_id": guild_id}},
+            {"$lookup": {
+                "from": "players",
+                "localField": "members",
+                "foreignField": "discord_id",
+                "as": "players"
+            }},
+            {"$project": {
+                "_id": 0,
+                "name": 1,
+                "abbreviation": 1,
+                "member_count": {"$size": {"$ifNull": ["$members", []]}},
+                "kills": {"$sum": "$players.total_kills"},
+                "deaths": {"$sum": "$players.total_deaths"},
+                "player_ids": "$players.player_id"
+            }},
+            {"$sort": {"kills": -1}},
+            {"$limit": limit}
+        ])
+        leaders = await cursor.to_list(limit)
+        
+        # Top weapons only for the factions shown, each through the killer_id index
+        top_weapons = await asyncio.gather(*(
+            self._top_weapon(db, faction.pop("player_ids")) for faction in leaders
+        ))
+        
+        for faction, top_weapon in zip(leaders, top_weapons):
+            faction["kd"] = faction["kills"] / max(1, faction["deaths"])
+            faction["top_weapon"] = top_weapon
+        
+        return leaders
+    
     @faction_group.command(name="leaderboard", description="View faction leaderboard for the server") 
     @premium_tier_required(tier=1)
     async def faction_leaderboard(self, ctx):
@@ -604,74 +723,17 @@ class FactionCommands(commands.Cog):
         db = self.bot.db
         
         # Get all factions in this guild
-        factions = await Faction.get_all_for_guild(db, ctx.guild.id)
+        factions = await self._get_guild_factions(db, ctx.guild.id)
         
         if not factions:
             await ctx.respond("No factions have been created in this server yet.", ephemeral=True)
             return
             
-        await ctx.respond("⏳ Calculating faction leaderboard...", ephemeral=True)
+        # Stats take a few queries, so acknowledge the interaction first
+        await ctx.defer()
         
-        # Calculate stats for each faction
-        faction_stats = []
-        
-        for faction in factions:
-            # Initialize faction stats
-            total_kills = 0
-            total_deaths = 0
-            weapon_counts = {}
-            
-            # Get player stats for each member
-            for member_id in faction.members:
-                players = await Player.get_by_discord_id(db, member_id)
-                
-                if not players:
-                    continue
-                    
-                for player in players:
-                    # Add to faction totals
-                    total_kills += player.total_kills
-                    total_deaths += player.total_deaths
-                    
-                    # Get detailed stats for this player
-                    try:
-                        # Get kill data to find weapons
-                        kills_collection = await db.get_collection("kills")
-                        cursor = kills_collection.find({
-                            "killer_id": player.player_id,
-                            "is_suicide": False
-                        })
-                        
-                        async for kill in cursor:
-                            # Track weapon usage
-                            weapon = kill.get("weapon", "Unknown")
-                            if weapon in weapon_counts:
-                                weapon_counts[weapon] += 1
-                            else:
-                                weapon_counts[weapon] = 1
-                    except Exception as e:
-                        logger.error(f"Error retrieving weapon stats: {e}")
-            
-            # Calculate K/D ratio
-            kd_ratio = total_kills / max(1, total_deaths)
-            
-            # Get top weapon
-            top_weapon = sorted(weapon_counts.items(), key=lambda x: x[1], reverse=True)
-            top_weapon_name = top_weapon[0][0] if top_weapon else "None"
-            
-            # Add to faction stats list
-            faction_stats.append({
-                "name": faction.name,
-                "abbreviation": faction.abbreviation,
-                "kills": total_kills,
-                "deaths": total_deaths,
-                "kd": kd_ratio,
-                "top_weapon": top_weapon_name,
-                "member_count": len(faction.members)
-            })
-        
-        # Sort factions by kills
-        faction_stats.sort(key=lambda x: x["kills"], reverse=True)
+        # Calculate stats for the top factions by kills
+        faction_stats = await self._faction_leaderboard(db, ctx.guild.id)
         
         # Create embed for leaderboard
         embed = discord.Embed(
@@ -686,7 +748,7 @@ class FactionCommands(commands.Cog):
         
         # Add formatted stats for top 5 factions
         stats_value = "```\n"
-        for i, faction in enumerate(faction_stats[:5], 1):
+        for i, faction in enumerate(faction_stats, 1):
             # Format each row with aligned columns
             faction_name = f"{faction['abbreviation']} {faction['name']}"
             if len(faction_name) > 14:
@@ -697,7 +759,7 @@ class FactionCommands(commands.Cog):
                 weapon_name = weapon_name[:13] + '..'
                 
             # Format: Rank, Name, Kills, Deaths, K/D ratio, Top weapon
-            stats_value += f"{i:<5}{faction_name:<16}{faction['kills']:<8}{faction['deaths']:<8}{faction['kd']:.2f:<6}{weapon_name:<15}\n"
+            stats_value += f"{i:<5}{faction_name:<16}{faction['kills']:<8}{faction['deaths']:<8}{faction['kd']:<6.2f}{weapon_name:<15}\n"
         
         stats_value += "```"
         embed.add_field(name="", value=stats_value, inline=False)
@@ -706,7 +768,7 @@ class FactionCommands(commands.Cog):
         embed.set_footer(text=f"Guild: {ctx.guild.name} | Total Factions: {len(factions)}")
         
         # Send the embed
-        await ctx.respond(embed=embed)
+        await ctx.followup.send(embed=embed)
 
 def setup(bot):
     bot.add_cog(FactionCommands(bot))
\ No newline at end of file
@@ -8,7 +8,7 @@ from database.connection import Database
 from database.models import Server, GuildConfig, AuthCredentials
 from utils.embeds import create_server_embed, create_success_embed, create_error_embed, create_info_embed
 from parsers.parser_memory import ParserMemory
-from utils.guild_isolation import get_servers_for_guild, can_add_server
+from utils.guild_isolation import get_servers_for_guild, can_add_server, invalidate_guild_servers
 from utils.premium import check_premium_feature, get_premium_limits
 from utils.game_query import query_game_server
 
@@ -119,6 +119,8 @@ class ServerCommands(commands.Cog):
                 server_id=serverid
             )
             
+            invalidate_guild_servers(ctx.guild.id)
+            
             # Create credentials immediately
             server_id = server.get("_id", "")
             await AuthCredentials.set_credentials(
@@ -222,6 +224,7 @@ class ServerCommands(commands.Cog):
                 
             # Remove server
             await Server.delete(self.db, server.get("_id", ""))
+            invalidate_guild_servers(ctx.guild.id)
             
             embed = create_success_embed(
                 "Server Removed",
@@ -279,6 +282,12 @@ class ServerCommands(commands.Cog):
                 
             # Apply updates
             await Server.update(self.db, server.get("_id", ""), updates)
+            invalidate_guild_servers(ctx.guild.id)
+            
+            # Keep connection notifications showing the current server name
+            connection_cog = self.bot.get_cog("ConnectionCommands")
+            if new_name is not None and connection_cog is not None:
+                await connection_cog.refresh_server_name(server.get("_id"))
             
             display_name = new_name if new_name else name
             embed = create_success_embed(
@@ -38,6 +38,18 @@ class Database:
                 raise
         return cls._instance
     
+    @classmethod
+    def instance(cls):
+        """
+        Get the singleton without awaiting, if it is already connected
+        
+        Returns:
+            Database or None: The connected instance, or None before the first get_instance()
+        """
+        if cls._instance is not None and cls._db is not None:
+            return cls._instance
+        return None
+    
     @classmethod
     async def _init_collections(cls):
         """Initialize collections and create indexes if they don't exist"""
@@ -61,8 +73,10 @@ class Database:
             kills = cls._db["kills"]
             await kills.create_index("timestamp")
             await kills.create_index("server_id")
-            await kills.create_index("killer_id")
+            # Covers faction weapon counts; also serves killer_id-only queries through its prefix
+            await kills.create_index([("killer_id", 1), ("is_suicide", 1), ("weapon", 1)])
             await kills.create_index("victim_id")
+            await kills.create_index([("server_id", 1), ("timestamp", 1)])
             
             # Create indexes for server_events collection
             server_events = cls._db["server_events"]
@@ -73,8 +87,9 @@ class Database:
             # Create indexes for connection_events collection
             connection_events = cls._db["connection_events"]
             await connection_events.create_index([("timestamp", -1)])
-            await connection_events.create_index("server_id")
             await connection_events.create_index("player_id")
+            # Also serves server_id-only queries through its prefix
+            await connection_events.create_index([("server_id", 1), ("_id", 1)])
             
             # Create indexes for parser_state collection
             parser_state = cls._db["parser_state"]
@@ -87,10 +102,12 @@ class Database:
             # Create indexes for guild_configs collection
             guild_configs = cls._db["guild_configs"]
             await guild_configs.create_index("guild_id", unique=True)
+            await guild_configs.create_index("connection_channel", sparse=True)
             
             # Create indexes for factions collection
             factions = cls._db["factions"]
-            await factions.create_index("guild_id")
+            # Serves member lookups and, through its prefix, guild_id-only queries
+            await factions.create_index([("guild_id", 1), ("members", 1)])
             await factions.create_index([("name", 1), ("guild_id", 1)], unique=True)
             await factions.create_index([("abbreviation", 1), ("guild_id", 1)], unique=True)
             await factions.create_index("leader_id")
@@ -149,6 +166,12 @@ class Database:
             logger.error(f"Error getting collection {collection_name}: {e}")
             raise
     
+    async def ping(self):
+        """Round-trip a ping command to MongoDB; raises if the server is unreachable"""
+        if self._db is None:
+            raise Exception("Database not initialized")
+        await self._db.command({"ping": 1})
+    
     async def get_home_guild_id(self):
         """Get the ID of the home guild"""
         try:
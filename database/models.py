@@ -279,6 +279,25 @@ class Player:
                 players.append(cls(**{**data, "_id": id_value}))
         return players
     
+    @classmethod
+    async def get_by_discord_ids(cls, db, discord_ids):
+        """Get all players linked to any of several Discord users, grouped by Discord ID"""
+        players = {discord_id: [] for discord_id in discord_ids}
+        if not players:
+            return players
+        
+        collection = await db.get_collection(cls.collection_name)
+        cursor = collection.find({"discord_id": {"$in": list(players)}})
+        
+        # Get all matching documents
+        docs = await cursor.to_list(None)
+        for data in docs:
+            # MongoDB already has _id
+            id_value = data.get("_id")
+            if id_value:
+                players[data["discord_id"]].append(cls(**{**data, "_id": id_value}))
+        return players
+    
     async def update(self, db):
         """Update player in the database"""
         data = self.to_dict()
@@ -747,8 +766,15 @@ class Faction:
         self.members = members or []  # List of discord_ids
         self.created_at = created_at or datetime.utcnow()
         self.role_id = role_id
+        # Parsed once so role lookups don't convert the stored string each time
+        self._role_snowflake = int(role_id) if role_id else None
         self._id = _id
     
+    @property
+    def role_snowflake(self):
+        """Discord role ID as an int, or None if the faction has no role"""
+        return self._role_snowflake
+    
     @classmethod
     async def create(cls, db, **kwargs):
         """Create a new faction in the database"""
@@ -847,6 +873,35 @@ class Faction:
             {"$set": data}
         )
     
+    async def add_member(self, db, member_id):
+        """Add a member to the faction without rewriting the whole document"""
+        collection = await db.get_collection(self.collection_name)
+        await collection.update_one(
+            {"_id": self._id},
+            {"$addToSet": {"members": member_id}}
+        )
+        if member_id not in self.members:
+            self.members.append(member_id)
+    
+    async def remove_member(self, db, member_id):
+        """Remove a member from the faction without rewriting the whole document"""
+        collection = await db.get_collection(self.collection_name)
+        await collection.update_one(
+            {"_id": self._id},
+            {"$pull": {"members": member_id}}
+        )
+        if member_id in self.members:
+            self.members.remove(member_id)
+    
+    async def set_leader(self, db, leader_id):
+        """Change the faction leader without rewriting the whole document"""
+        collection = await db.get_collection(self.collection_name)
+        await collection.update_one(
+            {"_id": self._id},
+            {"$set": {"leader_id": leader_id}}
+        )
+        self.leader_id = leader_id
+    
     async def delete(self, db):
         """Delete faction from the database"""
         collection = await db.get_collection(self.collection_name)
@@ -1155,9 +1155,12 @@ async def on_ready():
     guild_count = len(bot.guilds)
     logger.info(f"Bot is in {guild_count} guilds")
     
+    # Seed the running member total; AdminCommands' listeners keep it current
+    bot._member_total = 0
     for guild in bot.guilds:
         logger.info(f"Guild: {guild.name} (ID: {guild.id})")
         logger.info(f"  - Member count: {guild.member_count}")
+        bot._member_total += guild.member_count or 0
         if guild.owner_id:
             logger.info(f"  - Owner: {guild.owner_id}")
     
@@ -1279,6 +1282,9 @@ async def load_cogs():
         logger.error("Cannot load cogs - database not initialized")
         return
         
+    # The serialized command payload is rebuilt from the freshly loaded cogs
+    bot._cached_commands_payload = None
+    
     # First, unload any previously loaded cogs to avoid duplicates
     for cog_name in list(bot.cogs.keys()):
         try:
@@ -6,6 +6,7 @@ from datetime import datetime
 from database.connection import Database
 from database.models import Kill, Player, ParserState
 from utils.log_access import get_newest_csv_file
+from utils.analytics_cache import invalidate_server
 
 logger = logging.getLogger('deadside_bot.parsers.csv')
 
@@ -174,6 +175,8 @@ class CSVParser:
             
             if processed_records:
                 logger.info(f"Parsed {len(processed_records)} kill events from CSV for server {self.server_id}")
+                # New kills make cached server stats and leaderboards stale
+                invalidate_server(self.server_id)
             
             return processed_records
             
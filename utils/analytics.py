@@ -8,12 +8,19 @@ allowing for detailed insights into game activity and performance metrics.
 import logging
 import asyncio
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple, Union
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple, Union
 from database.connection import Database
 from database.models import Player, Kill, ConnectionEvent, Server
 
 logger = logging.getLogger('deadside_bot.utils.analytics')
 
+# Leaderboard sort option -> aggregated field it ranks by
+LEADERBOARD_SORT_FIELDS = {
+    "kills": "kills",
+    "kd": "kd_ratio",
+    "distance": "avg_distance"
+}
+
 class AnalyticsService:
     """Service for generating advanced analytics and statistics"""
     
@@ -29,115 +36,91 @@ class AnalyticsService:
         Returns:
             Dict containing server statistics
         """
-        db = await Database.get_instance()
+        db = Database.instance() or await Database.get_instance()
         start_date = datetime.utcnow() - timedelta(days=time_period)
         
-        # Get kill events within time period
-        kills_collection = await db.get_collection("kills")
-        total_kills = await kills_collection.count_documents({
-            "server_id": server_id,
-            "timestamp": {"$gte": start_date}
-        })
-        
-        # Get suicide count
-        suicide_count = await kills_collection.count_documents({
-            "server_id": server_id,
-            "timestamp": {"$gte": start_date},
-            "is_suicide": True
-        })
-        
-        # Get unique player count
-        player_ids = set()
-        cursor = kills_collection.find({
-            "server_id": server_id,
-            "timestamp": {"$gte": start_date}
-        })
+        kills_collection, connections_collection = await asyncio.gather(
+            db.get_collection("kills"),
+            db.get_collection("connection_events")
+        )
         
-        async for doc in cursor:
-            player_ids.add(doc["killer_id"])
-            player_ids.add(doc["victim_id"])
-        
-        unique_players = len(player_ids)
-        
-        # Get connection events
-        connections_collection = await db.get_collection("connection_events")
-        joins = await connections_collection.count_documents({
-            "server_id": server_id,
-            "timestamp": {"$gte": start_date},
-            "event_type": "connect"
-        })
-        
-        leaves = await connections_collection.count_documents({
-            "server_id": server_id,
-            "timestamp": {"$gte": start_date},
-            "event_type": "disconnect"
-        })
-        
-        # Get most active hours (hour of day with most kills)
-        pipeline = [
+        # Compute every kill-based metric in one pass over the window
+        kills_pipeline = [
             {"$match": {
                 "server_id": server_id,
                 "timestamp": {"$gte": start_date}
             }},
-            {"$project": {
-                "hour": {"$hour": "$timestamp"}
-            }},
-            {"$group": {
-                "_id": "$hour",
-                "count": {"$sum": 1}
-            }},
-            {"$sort": {"count": -1}},
-            {"$limit": 3}
+            {"$facet": {
+                "totals": [
+                    {"$group": {
+                        "_id": None,
+                        "total_kills": {"$sum": 1},
+                        "suicide_count": {"$sum": {"$cond": [{"$eq": ["$is_suicide", True]}, 1, 0]}},
+                        # Average kill distance (non-suicides only)
+                        "avg_distance": {"$avg": {"$cond": [{"$eq": ["$is_suicide", False]}, "$distance", None]}}
+                    }}
+                ],
+                # Unique players (killers and victims)
+                "players": [
+                    {"$project": {"ids": ["$killer_id", "$victim_id"]}},
+                    {"$unwind": "$ids"},
+                    {"$group": {"_id": "$ids"}},
+                    {"$count": "count"}
+                ],
+                # Most active hours (hour of day with most kills)
+                "hours": [
+                    {"$group": {"_id": {"$hour": "$timestamp"}, "count": {"$sum": 1}}},
+                    {"$sort": {"count": -1}},
+                    {"$limit": 3}
+                ],
+                # Most used weapons
+                "weapons": [
+                    {"$group": {"_id": "$weapon", "count": {"$sum": 1}}},
+                    {"$sort": {"count": -1}},
+                    {"$limit": 5}
+                ]
+            }}
         ]
         
-        cursor = kills_collection.aggregate(pipeline)
-        most_active_hours = []
-        async for doc in cursor:
-            most_active_hours.append({
-                "hour": doc["_id"],
-                "count": doc["count"]
-            })
-        
-        # Get most used weapons
-        pipeline = [
+        # Get connection events, counted per type alongside the kills pipeline
+        connections_pipeline = [
             {"$match": {
                 "server_id": server_id,
-                "timestamp": {"$gte": start_date}
-            }},
-            {"$group": {
-                "_id": "$weapon",
-                "count": {"$sum": 1}
+                "timestamp": {"$gte": start_date},
+                "event_type": {"$in": ["connect", "disconnect"]}
             }},
-            {"$sort": {"count": -1}},
-            {"$limit": 5}
+            {"$group": {"_id": "$event_type", "count": {"$sum": 1}}}
         ]
         
-        cursor = kills_collection.aggregate(pipeline)
-        weapons = []
-        async for doc in cursor:
-            if doc["_id"] and doc["_id"].strip():  # Skip empty weapon names
-                weapons.append({
-                    "name": doc["_id"],
-                    "count": doc["count"]
-                })
+        kill_facets, connection_counts = await asyncio.gather(
+            kills_collection.aggregate(kills_pipeline).to_list(1),
+            connections_collection.aggregate(connections_pipeline).to_list(None)
+        )
         
-        # Get average kill distance
-        pipeline = [
-            {"$match": {
-                "server_id": server_id,
-                "timestamp": {"$gte": start_date},
-                "is_suicide": False
-            }},
-            {"$group": {
-                "_id": None,
-                "avg_distance": {"$avg": "$distance"}
-            }}
+        facets = kill_facets[0] if kill_facets else {}
+        totals = facets.get("totals") or [{}]
+        totals = totals[0]
+        players = facets.get("players") or [{}]
+        
+        total_kills = totals.get("total_kills", 0)
+        suicide_count = totals.get("suicide_count", 0)
+        avg_distance = round(totals.get("avg_distance") or 0, 2)
+        unique_players = players[0].get("count", 0)
+        
+        most_active_hours = [
+            {"hour": doc["_id"], "count": doc["count"]}
+            for doc in facets.get("hours", [])
         ]
         
-        cursor = kills_collection.aggregate(pipeline)
-        avg_distance = 0
-        async for doc in cursor:
-            avg_distance = round(doc["avg_distance"], 2)
+        weapons = [
+            {"name": doc["_id"], "count": doc["count"]}
+            for doc in facets.get("weapons", [])
+            if doc["_id"] and doc["_id"].strip()  # Skip empty weapon names
+        ]
+        
+        connection_counts = {doc["_id"]: doc["count"] for doc in connection_counts}
+        joins = connection_counts.get("connect", 0)
+        leaves = connection_counts.get("disconnect", 0)
         
         return {
             "time_period": time_period,
@@ -163,7 +146,7 @@ class AnalyticsService:
         Returns:
             Dict containing player analytics
         """
-        db = await Database.get_instance()
+        db = Database.instance() or await Database.get_instance()
         start_date = datetime.utcnow() - timedelta(days=time_period)
         
         # Get the player from database
@@ -389,140 +372,134 @@ class AnalyticsService:
         Returns:
             List of player leaderboard entries
         """
-        db = await Database.get_instance()
-        leaderboard = []
+        return [
+            entry async for entry in
+            AnalyticsService.iter_leaderboard(server_id, sort_by, limit, time_period)
+        ]
+    
+    @staticmethod
+    async def iter_leaderboard(server_id: str, sort_by: str = "kills", limit: int = 10,
+                               time_period: Optional[int] = 7) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield leaderboard entries for a server in rank order as the cursor returns them
+        
+        Args:
+            server_id: MongoDB ObjectId of the server
+            sort_by: Metric to sort by ('kills', 'kd', 'distance', 'headshots')
+            limit: Maximum number of players to include
+            time_period: Number of days to include (None = all-time stats)
+            
+        Yields:
+            Player leaderboard entries, already ranked and limited server-side
+        """
+        db = Database.instance() or await Database.get_instance()
         
         if time_period is None:
             # Use all-time stats from player records
             players_collection = await db.get_collection("players")
             
-            # Get top players based on sort criteria
-            if sort_by == "kills":
-                cursor = players_collection.find().sort("total_kills", -1).limit(limit)
-            elif sort_by == "kd":
-                # Need to calculate KD ratio during processing
-                cursor = players_collection.find().sort("total_kills", -1).limit(limit * 3)  # Get more to filter
-            else:
-                # Default to kills for other criteria when using all-time stats
-                cursor = players_collection.find().sort("total_kills", -1).limit(limit)
-            
-            async for doc in cursor:
-                player = Player(**{**doc, "_id": doc.get("_id")})
-                
-                kd_ratio = player.total_kills / max(player.total_deaths, 1)
-                
-                leaderboard.append({
-                    "player_id": player.player_id,
-                    "player_name": player.player_name,
-                    "kills": player.total_kills,
-                    "deaths": player.total_deaths,
-                    "kd_ratio": round(kd_ratio, 2),
-                    "faction_id": player.faction_id
-                })
-                
-            # If sorting by KD, we need to sort the processed results
+            # Top players by kills; for K/D, re-rank a wider pool of top killers
+            pipeline = [
+                {"$sort": {"total_kills": -1}},
+                {"$limit": limit * 3 if sort_by == "kd" else limit},
+                {"$project": {
+                    "_id": 0,
+                    "player_id": 1,
+                    "player_name": 1,
+                    "kills": {"$ifNull": ["$total_kills", 0]},
+                    "deaths": {"$ifNull": ["$total_deaths", 0]},
+                    "faction_id": {"$ifNull": ["$faction_id", None]}
+                }},
+                {"$addFields": {
+                    "kd_ratio": {"$round": [{"$divide": ["$kills", {"$max": ["$deaths", 1]}]}, 2]}
+                }}
+            ]
             if sort_by == "kd":
-                leaderboard.sort(key=lambda x: x["kd_ratio"], reverse=True)
-                leaderboard = leaderboard[:limit]  # Trim to desired limit
+                pipeline += [
+                    {"$sort": {"kd_ratio": -1, "kills": -1}},
+                    {"$limit": limit}
+                ]
+            
+            async for entry in players_collection.aggregate(pipeline):
+                yield entry
                 
         else:
             # Get time-specific stats from kill events
             start_date = datetime.utcnow() - timedelta(days=time_period)
             kills_collection = await db.get_collection("kills")
             
-            # Get list of player IDs from kill events
-            player_stats = {}
-            cursor = kills_collection.find({
-                "server_id": server_id,
-                "timestamp": {"$gte": start_date}
-            })
-            
-            async for doc in cursor:
-                killer_id = doc["killer_id"]
-                victim_id = doc["victim_id"]
-                is_suicide = doc.get("is_suicide", False)
-                distance = doc.get("distance", 0)
-                
-                # Process killer stats (skip if suicide)
-                if not is_suicide:
-                    if killer_id not in player_stats:
-                        player_stats[killer_id] = {
-                            "player_id": killer_id,
-                            "player_name": doc["killer_name"],
-                            "kills": 0,
-                            "deaths": 0,
-                            "total_distance": 0,
-                            "kill_count_for_distance": 0,
-                            "longest_kill": 0
-                        }
-                    
-                    player_stats[killer_id]["kills"] += 1
-                    player_stats[killer_id]["player_name"] = doc["killer_name"]  # Update name in case it changed
-                    
-                    # Track distance stats
-                    if distance > 0:
-                        player_stats[killer_id]["total_distance"] += distance
-                        player_stats[killer_id]["kill_count_for_distance"] += 1
-                        player_stats[killer_id]["longest_kill"] = max(
-                            player_stats[killer_id]["longest_kill"], distance
-                        )
-                
-                # Process victim stats (always count deaths)
-                if victim_id not in player_stats:
-                    player_stats[victim_id] = {
-                        "player_id": victim_id,
-                        "player_name": doc["victim_name"],
-                        "kills": 0,
-                        "deaths": 0,
-                        "total_distance": 0,
-                        "kill_count_for_distance": 0,
-                        "longest_kill": 0
-                    }
-                
-                player_stats[victim_id]["deaths"] += 1
-                player_stats[victim_id]["player_name"] = doc["victim_name"]  # Update name in case it changed
+            # Aggregate per-player stats server-side: each kill yields a killer
+            # record (unless it was a suicide) and a victim record, which are
+            # grouped, ranked and trimmed before anything is sent back
+            sort_field = LEADERBOARD_SORT_FIELDS.get(sort_by, "kills")
+            pipeline = [
+                {"$match": {
+                    "server_id": server_id,
+                    "timestamp": {"$gte": start_date}
+                }},
+                # Oldest first so $last picks each player's most recent name
+                {"$sort": {"timestamp": 1}},
+                {"$project": {
+                    "_id": 0,
+                    "records": {"$concatArrays": [
+                        {"$cond": [
+                            {"$ne": ["$is_suicide", True]},
+                            [{
+                                "id": "$killer_id",
+                                "name": "$killer_name",
+                                "kill": 1,
+                                "death": 0,
+                                "distance": {"$cond": [{"$gt": ["$distance", 0]}, "$distance", None]}
+                            }],
+                            []
+                        ]},
+                        [{
+                            "id": "$victim_id",
+                            "name": "$victim_name",
+                            "kill": 0,
+                            "death": 1,
+                            "distance": None
+                        }]
+                    ]}
+                }},
+                {"$unwind": "$records"},
+                {"$group": {
+                    "_id": "$records.id",
+                    "player_name": {"$last": "$records.name"},
+                    "kills": {"$sum": "$records.kill"},
+                    "deaths": {"$sum": "$records.death"},
+                    "avg_distance": {"$avg": "$records.distance"},
+                    "longest_kill": {"$max": "$records.distance"}
+                }},
+                {"$addFields": {
+                    "kd_ratio": {"$round": [{"$divide": ["$kills", {"$max": ["$deaths", 1]}]}, 2]},
+                    "avg_distance": {"$round": [{"$ifNull": ["$avg_distance", 0]}, 2]},
+                    "longest_kill": {"$ifNull": ["$longest_kill", 0]}
+                }},
+                {"$sort": {sort_field: -1, "_id": 1}},
+                {"$limit": limit},
+                # Faction info for just the ranked players
+                {"$lookup": {
+                    "from": "players",
+                    "localField": "_id",
+                    "foreignField": "player_id",
+                    "as": "player"
+                }},
+                {"$project": {
+                    "_id": 0,
+                    "player_id": "$_id",
+                    "player_name": 1,
+                    "kills": 1,
+                    "deaths": 1,
+                    "kd_ratio": 1,
+                    "avg_distance": 1,
+                    "longest_kill": 1,
+                    "faction_id": {"$arrayElemAt": ["$player.faction_id", 0]}
+                }}
+            ]
             
-            # Finalize player stats and prepare for sorting
-            for player_id, stats in player_stats.items():
-                # Calculate KD ratio
-                kd_ratio = stats["kills"] / max(stats["deaths"], 1)
-                stats["kd_ratio"] = round(kd_ratio, 2)
-                
-                # Calculate average kill distance
-                if stats["kill_count_for_distance"] > 0:
-                    stats["avg_distance"] = round(stats["total_distance"] / stats["kill_count_for_distance"], 2)
-                else:
-                    stats["avg_distance"] = 0
-                
-                # Get faction info
-                player = await Player.get_by_player_id(db, player_id)
-                if player:
-                    stats["faction_id"] = player.faction_id
-                else:
-                    stats["faction_id"] = None
-            
-            # Convert to list and sort based on criteria
-            player_list = list(player_stats.values())
-            
-            if sort_by == "kills":
-                player_list.sort(key=lambda x: x["kills"], reverse=True)
-            elif sort_by == "kd":
-                player_list.sort(key=lambda x: x["kd_ratio"], reverse=True)
-            elif sort_by == "distance":
-                player_list.sort(key=lambda x: x["avg_distance"], reverse=True)
-            else:
-                # Default to kills
-                player_list.sort(key=lambda x: x["kills"], reverse=True)
-            
-            # Apply limit and select fields for response
-            leaderboard = player_list[:limit]
-            
-            # Clean up response
-            for entry in leaderboard:
-                entry.pop("total_distance", None)
-                entry.pop("kill_count_for_distance", None)
-        
-        return leaderboard
+            async for entry in kills_collection.aggregate(pipeline):
+                yield entry
     
     @staticmethod
     async def get_faction_analytics(faction_id: str, time_period: int = 7) -> Dict[str, Any]:
@@ -536,7 +513,7 @@ class AnalyticsService:
         Returns:
             Dict containing faction analytics
         """
-        db = await Database.get_instance()
+        db = Database.instance() or await Database.get_instance()
         start_date = datetime.utcnow() - timedelta(days=time_period)
         
         # Get all players in the faction
@@ -0,0 +1,126 @@
+"""
+Analytics Cache
+
+This module provides a short-lived in-process cache for AnalyticsService results,
+so repeated analytics commands for the same window don't re-run the aggregations.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+logger = logging.getLogger('deadside_bot.utils.analytics_cache')
+
+# How long (in seconds) a computed analytics result is reused
+ANALYTICS_CACHE_TTL = 120
+
+# Maximum number of cached results kept at once
+ANALYTICS_CACHE_MAX_SIZE = 1024
+
+# Maps (kind, entity ID, ...) -> (value, expires_at)
+_cache: Dict[Tuple, Tuple[Any, float]] = {}
+
+# Per-key locks so concurrent misses for the same key compute it only once
+_locks: Dict[Tuple, asyncio.Lock] = {}
+
+def _evict(now: float):
+    """Drop expired entries, then the oldest ones if the cache is still full"""
+    for key in [key for key, (_, expires_at) in _cache.items() if expires_at <= now]:
+        del _cache[key]
+
+    # Dicts keep insertion order, so the first keys are the oldest
+    while len(_cache) >= ANALYTICS_CACHE_MAX_SIZE:
+        del _cache[next(iter(_cache))]
+
+async def get_or_compute(key: Tuple[Hashable, ...], coro_factory: Callable[[], Awaitable[Any]],
+                         ttl: float = ANALYTICS_CACHE_TTL) -> Any:
+    """
+    Get a cached analytics result, computing and storing it on a miss
+
+    Args:
+        key: Cache key, starting with the kind of result and the entity ID
+        coro_factory: Callable returning the coroutine that computes the result
+        ttl: Seconds the computed result stays valid
+
+    Returns:
+        The cached or freshly computed result
+    """
+    entry = _cache.get(key)
+    if entry is not None and entry[1] > time.monotonic():
+        return entry[0]
+
+    lock = _locks.setdefault(key, asyncio.Lock())
+    try:
+        async with lock:
+            # Another caller may have filled the entry while we waited
+            entry = _cache.get(key)
+            now = time.monotonic()
+            if entry is not None and entry[1] > now:
+                return entry[0]
+
+            value = await coro_factory()
+
+            now = time.monotonic()
+            _cache.pop(key, None)
+            _evict(now)
+            _cache[key] = (value, now + ttl)
+    finally:
+        # Drop the lock even if the computation failed, unless another caller is waiting
+        if not lock.locked():
+            _locks.pop(key, None)
+    return value
+
+async def refresh(key: Tuple[Hashable, ...], coro_factory: Callable[[], Awaitable[Any]],
+                  ttl: float = ANALYTICS_CACHE_TTL) -> Any:
+    """
+    Recompute an analytics result and store it, even if a cached copy is still valid
+
+    Args:
+        key: Cache key, starting with the kind of result and the entity ID
+        coro_factory: Callable returning the coroutine that computes the result
+        ttl: Seconds the computed result stays valid
+
+    Returns:
+        The freshly computed result
+    """
+    lock = _locks.setdefault(key, asyncio.Lock())
+    try:
+        async with lock:
+            value = await coro_factory()
+
+            now = time.monotonic()
+            _cache.pop(key, None)
+            _evict(now)
+            _cache[key] = (value, now + ttl)
+    finally:
+        if not lock.locked():
+            _locks.pop(key, None)
+    return value
+
+def invalidate(kind: str, entity_id: Any):
+    """
+    Drop all cached results of one kind for an entity
+
+    Args:
+        kind: Result kind (e.g. "server", "leaderboard")
+        entity_id: Server, player or faction ID the results belong to
+    """
+    entity_key = str(entity_id)
+    for key in [key for key in _cache if key[0] == kind and key[1] == entity_key]:
+        _cache.pop(key, None)
+
+def invalidate_server(server_id: Any):
+    """
+    Drop cached server stats and leaderboards after new events land for a server
+
+    Args:
+        server_id: MongoDB ObjectId of the server
+    """
+    invalidate("server", server_id)
+    invalidate("leaderboard", server_id)
+
+def invalidate_all():
+    """Drop every cached analytics result"""
+    _cache.clear()
+    logger.debug("Cleared analytics cache")
@@ -641,6 +641,47 @@ def create_connection_embed(connection_data: Dict[str, Any]) -> discord.Embed:
     
     return embed
 
+# Title template and color for each player connection event type
+_PLAYER_CONNECTION_STYLES = {
+    "connect": ("🟢 {} connected", discord.Color.green()),
+    "disconnect": ("🔴 {} disconnected", discord.Color.red()),
+    "kick": ("⛔ {} was kicked", discord.Color.gold()),
+}
+
+def create_player_connection_embed(connection: Any, server_name: str) -> discord.Embed:
+    """
+    Create an embed announcing a player connecting, disconnecting or being kicked
+    
+    Args:
+        connection: ConnectionEvent object
+        server_name: Name of the server the event happened on
+        
+    Returns:
+        discord.Embed: Formatted connection notification embed
+    """
+    style = _PLAYER_CONNECTION_STYLES.get(connection.event_type)
+    if style is not None:
+        title, color = style[0].format(connection.player_name), style[1]
+    else:
+        title, color = f"ℹ️ {connection.player_name} {connection.event_type}", discord.Color.blue()
+    
+    embed = discord.Embed(
+        title=title,
+        description=f"Server: {server_name}",
+        color=color,
+        timestamp=connection.timestamp
+    )
+    
+    # Add kick reason if applicable
+    if connection.event_type == "kick" and connection.reason:
+        embed.add_field(name="Reason", value=connection.reason)
+    
+    # Add player ID if available
+    if connection.player_id:
+        embed.set_footer(text=f"Player ID: {connection.player_id}")
+    
+    return embed
+
 def create_mission_embed(mission_data: Dict[str, Any], server_name: Optional[str] = "") -> discord.Embed:
     """
     Create an embed displaying mission information
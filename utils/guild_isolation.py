@@ -6,10 +6,19 @@ preventing cross-guild data access.
 """
 
 import logging
+import time
 from bson.objectid import ObjectId
 
+from database.models import Server
+
 logger = logging.getLogger('deadside_bot.utils.guild_isolation')
 
+# How long (in seconds) a guild's server list is reused before refetching
+GUILD_SERVERS_CACHE_TTL = 120
+
+# Maps guild ID -> (list of server documents, expires_at)
+_guild_servers_cache = {}
+
 async def get_servers_for_guild(db, guild_id):
     """
     Get all servers for a specific guild
@@ -49,6 +58,40 @@ async def get_guild_servers(db, guild_id):
         logger.error(f"Error in get_guild_servers: {e}")
         return []
 
+async def get_cached_guild_servers(db, guild_id):
+    """
+    Get the server documents for a guild, reusing a recent lookup when possible
+    
+    Args:
+        db: Database connection
+        guild_id: Discord guild ID
+        
+    Returns:
+        list: List of server documents
+    """
+    guild_key = str(guild_id)
+    now = time.monotonic()
+    
+    entry = _guild_servers_cache.get(guild_key)
+    if entry is not None and entry[1] > now:
+        return entry[0]
+    
+    servers = await Server.get_by_guild(db, guild_key)
+    
+    # Empty results may come from a failed lookup, so only cache real lists
+    if servers:
+        _guild_servers_cache[guild_key] = (servers, now + GUILD_SERVERS_CACHE_TTL)
+    return servers
+
+def invalidate_guild_servers(guild_id):
+    """
+    Drop the cached server list for a guild after servers are added, changed or removed
+    
+    Args:
+        guild_id: Discord guild ID
+    """
+    _guild_servers_cache.pop(str(guild_id), None)
+
 async def get_server_by_name(db, server_name, guild_id):
     """
     Get a server by name, ensuring it belongs to the specified guild